@@ -0,0 +1,77 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Micro-benchmark of the per-call cost of the marker detector, comparing the
+legacy per-frame setup (dictionary + parameters rebuilt on every call) with the
+cached `arucoMarkerDetector` engine, and headless detection against
+detection followed by annotation.
+
+Usage: python -m benchmarks.bench_detector_engine [--width 1280 --height 720]
+"""
+
+import argparse
+import cv2 as cv
+from benchmarks.utils import SYNTHETIC_CAMERA_MATRIX, SYNTHETIC_DIST_COEFFS, printTimings, syntheticMask, timeCalls
+from src.marker_detector.arucoDetector import arucoMarkerDetector, getArucoDict
+
+
+def legacySetupAndDetect(frame, dictName: str):
+    # Replicates the setup previously done in `arucoDetector()` on every frame
+    dictionary = getArucoDict(dictName)
+    parameters = cv.aruco.DetectorParameters()
+    parameters.minMarkerPerimeterRate = 0.1
+    parameters.minCornerDistanceRate = 0.05
+    parameters.maxErroneousBitsInBorderRate = 0.35
+    return cv.aruco.detectMarkers(frame, dictionary, parameters=parameters)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--repeats', type=int, default=200)
+    parser.add_argument('--dictionary', type=str,
+                        default="DICT_ARUCO_MIP_36H12")
+    args = parser.parse_args()
+
+    # Prepare the inputs
+    mask, _ = syntheticMask(args.width, args.height,
+                            dictName=args.dictionary)
+    emptyMask = mask * 0
+    detector = arucoMarkerDetector({'structure': {'size': 0.163},
+                                    'detection': {'dictionary': args.dictionary}})
+
+    print(f"[Info] Detector micro-benchmark on {args.width}x{args.height} masks "
+          f"({args.repeats} calls each)")
+
+    # Setup only (what is saved per call)
+    printTimings("legacy setup (dict + parameters)", timeCalls(
+        lambda: (getArucoDict(args.dictionary), cv.aruco.DetectorParameters()), args.repeats))
+
+    # Full calls on frames with and without markers
+    for label, frame in [("markers", mask), ("empty", emptyMask)]:
+        printTimings(f"legacy detectMarkers [{label}]", timeCalls(
+            lambda: legacySetupAndDetect(frame, args.dictionary), args.repeats))
+        printTimings(f"cached ArucoDetector [{label}]", timeCalls(
+            lambda: detector.detector.detectMarkers(frame), args.repeats))
+
+    # Headless detection (with poses) vs. detection followed by annotation
+    frameBGR = cv.cvtColor(mask, cv.COLOR_GRAY2BGR)
+    printTimings("detect (headless, with poses)", timeCalls(
+        lambda: detector.detect(mask, SYNTHETIC_CAMERA_MATRIX, SYNTHETIC_DIST_COEFFS),
+        args.repeats))
+    printTimings("detect + annotate", timeCalls(
+        lambda: detector.annotate(
+            frameBGR.copy(), detector.detect(frameBGR, SYNTHETIC_CAMERA_MATRIX,
+                                             SYNTHETIC_DIST_COEFFS),
+            SYNTHETIC_CAMERA_MATRIX, SYNTHETIC_DIST_COEFFS), args.repeats))
+
+
+if __name__ == '__main__':
+    main()
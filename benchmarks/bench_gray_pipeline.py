@@ -0,0 +1,121 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Benchmark of the mask -> detection -> annotation path of the offline video mode,
+comparing the legacy BGR path (mask converted with GRAY2BGR before detection)
+with the grayscale-native one (BGR only produced by the annotation step).
+Reports time and bytes allocated (peak traced by `tracemalloc`) per frame.
+
+Usage:
+    python -m benchmarks.bench_gray_pipeline                     # synthetic masks
+    python -m benchmarks.bench_gray_pipeline --video x.mov       # masks of a video
+"""
+
+import argparse
+import time
+import tracemalloc
+import cv2 as cv
+import numpy as np
+from src.utils import readConfig
+from src.pipeline.sources import processingWidth
+from src.marker_detector.arucoDetector import arucoMarkerDetector
+from benchmarks.utils import SYNTHETIC_CAMERA_MATRIX, SYNTHETIC_DIST_COEFFS, syntheticMask
+
+
+def videoMasks(path: str, config: dict, maxFrames: int) -> list:
+    # Produce the masks exactly as the offline video mode does
+    from src.iMarker_algorithms.process import singleFrameProcessing
+    masks = []
+    cap = cv.VideoCapture(path)
+    while len(masks) < maxFrames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        maxWidth = processingWidth(config)
+        if maxWidth and frame.shape[1] > maxWidth:
+            frame = cv.resize(frame, (maxWidth, round(frame.shape[0] * maxWidth / frame.shape[1])),
+                              interpolation=cv.INTER_AREA)
+        _, mask = singleFrameProcessing(frame, True, config)
+        masks.append(mask)
+    cap.release()
+    return masks
+
+
+def legacyPath(detector, mask, annotate: bool):
+    # Mask converted to BGR before detection
+    maskBGR = cv.cvtColor(mask, cv.COLOR_GRAY2BGR)
+    result = detector.detect(maskBGR, SYNTHETIC_CAMERA_MATRIX,
+                             SYNTHETIC_DIST_COEFFS)
+    if not annotate:
+        return result
+    return detector.annotate(maskBGR, result, SYNTHETIC_CAMERA_MATRIX,
+                             SYNTHETIC_DIST_COEFFS)
+
+
+def grayPath(detector, mask, annotate: bool):
+    # Mask kept single-channel, BGR only produced for the annotated output
+    result = detector.detect(mask, SYNTHETIC_CAMERA_MATRIX,
+                             SYNTHETIC_DIST_COEFFS)
+    if not annotate:
+        return result
+    return detector.annotate(mask, result, SYNTHETIC_CAMERA_MATRIX,
+                             SYNTHETIC_DIST_COEFFS)
+
+
+def measure(label: str, function, detector, masks: list, annotate: bool):
+    # Variables
+    durations, allocations = [], []
+
+    # Run the path on every mask
+    tracemalloc.start()
+    for mask in masks:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        output = function(detector, mask, annotate)
+        durations.append((time.perf_counter() - start) * 1000.0)
+        allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+        del output
+    tracemalloc.stop()
+
+    print(f"- {label:<36} time/frame p50: {np.median(durations):7.3f} ms | "
+          f"mean: {np.mean(durations):7.3f} ms | "
+          f"allocated/frame: {np.mean(allocations) / 1024:9.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--video', type=str, default=None)
+    parser.add_argument('--config', type=str, default='config/config.yaml')
+    parser.add_argument('--frames', type=int, default=100)
+    args = parser.parse_args()
+
+    config = readConfig(args.config)['configs']
+
+    # Prepare the masks
+    if args.video:
+        masks = videoMasks(args.video, config, args.frames)
+    else:
+        masks = [syntheticMask(numMarkers=4, seed=index)[0]
+                 for index in range(args.frames)]
+    height, width = masks[0].shape[:2]
+    print(f"[Info] {len(masks)} masks of {width}x{height}")
+
+    # Compare both paths with the configured detector
+    detector = arucoMarkerDetector(config['marker'])
+    for annotate in [True, False]:
+        suffix = "with annotation" if annotate else "detection only"
+        measure(f"legacy (GRAY2BGR), {suffix}", legacyPath, detector, masks,
+                annotate)
+        measure(f"grayscale-native, {suffix}", grayPath, detector, masks,
+                annotate)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Benchmark of the multi-dictionary detection: one detector per dictionary run
+sequentially against a single detector sharing the candidates among all the
+dictionaries, on synthetic masks mixing markers of several dictionaries.
+
+Usage: python -m benchmarks.bench_multidict [--dictionaries DICT_A DICT_B ...]
+"""
+
+import argparse
+import numpy as np
+from src.marker_detector.arucoDetector import arucoMarkerDetector
+from benchmarks.utils import syntheticMask, timeCalls, printTimings
+
+
+def mixedMask(dictNames: list, width: int, height: int, numMarkers: int,
+              markerPixels: int, seed: int):
+    # Side-by-side strips, each with the markers of one dictionary
+    stripWidth = width // len(dictNames)
+    strips, groundTruth = [], []
+    for index, dictName in enumerate(dictNames):
+        strip, truth = syntheticMask(stripWidth, height, numMarkers, markerPixels,
+                                     dictName, seed + index)
+        strips.append(strip)
+        groundTruth.append(set(truth))
+    return np.hstack(strips), groundTruth
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dictionaries', nargs='+',
+                        default=["DICT_ARUCO_MIP_36H12", "DICT_APRILTAG_36h11"])
+    parser.add_argument('--markers', type=int, default=2,
+                        help='markers per dictionary')
+    parser.add_argument('--markerPixels', type=int, default=110)
+    parser.add_argument('--repeats', type=int, default=100)
+    args = parser.parse_args()
+
+    # Variables
+    mask, groundTruth = mixedMask(args.dictionaries, 1280, 720, args.markers,
+                                  args.markerPixels, seed=0)
+    sequential = [arucoMarkerDetector({'structure': {'size': 0.163},
+                                       'detection': {'dictionary': name}})
+                  for name in args.dictionaries]
+    shared = arucoMarkerDetector({'structure': {'size': 0.163},
+                                  'detection': {'dictionary': args.dictionaries}})
+    print(f"[Info] 1280x720 mask with {args.markers} markers of each of "
+          f"{', '.join(args.dictionaries)} (native multi-dictionary: "
+          f"{shared.nativeMultiDict})")
+
+    # Recall of both variants
+    for label, results in [
+            ("sequential", [detector.detect(mask) for detector in sequential]),
+            ("shared", [shared.detect(mask)])]:
+        hits = np.zeros(len(args.dictionaries), dtype=int)
+        for dictIndex, truth in enumerate(groundTruth):
+            for resultIndex, result in enumerate(results):
+                indices = result.dictIndices + resultIndex
+                hits[dictIndex] += sum(id in truth for id, index in
+                                       zip(result.ids, indices) if index == dictIndex)
+        print(f"- {label:<10} hits per dictionary: {hits.tolist()} "
+              f"(expected: {[len(truth) for truth in groundTruth]})")
+
+    # Timings
+    durationsSequential = timeCalls(
+        lambda: [detector.detect(mask) for detector in sequential], args.repeats)
+    durationsShared = timeCalls(lambda: shared.detect(mask), args.repeats)
+    printTimings(f"{len(args.dictionaries)} sequential detections", durationsSequential)
+    printTimings("single pass with shared candidates", durationsShared)
+    saved = np.median(durationsSequential) - np.median(durationsShared)
+    print(f"[Info] Time saved per frame: {saved:.3f} ms "
+          f"({saved / np.median(durationsSequential) * 100:.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Benchmark of the pose stage, comparing the legacy `estimatePoseSingleMarkers`
+followed by a per-marker Python loop with the batched `estimatePoses`.
+
+Usage: python -m benchmarks.bench_pose [--markers 1 20 40]
+"""
+
+import argparse
+import cv2 as cv
+import numpy as np
+from src.marker_detector.arucoDetector import arucoMarkerDetector, estimatePoses
+from benchmarks.utils import SYNTHETIC_CAMERA_MATRIX, printTimings, syntheticMask, timeCalls
+
+# Mild distortion so that the undistortion step is exercised
+DIST_COEFFS = np.array([0.1, -0.05, 0.001, 0.001, 0.0])
+
+
+def legacyPoses(corners, markerSize: float):
+    # Replicates the pose stage previously done in `arucoDetector()`
+    rotationVecs, translationVecs, _ = cv.aruco.estimatePoseSingleMarkers(
+        corners, markerSize, SYNTHETIC_CAMERA_MATRIX, DIST_COEFFS)
+    distances = [np.linalg.norm(translationVecs[id])
+                 for id in range(len(corners))]
+    return rotationVecs, translationVecs, distances
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--markers', type=int, nargs='+', default=[1, 20, 40])
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    markerSize = 0.163
+    detector = arucoMarkerDetector({'structure': {'size': markerSize},
+                                    'detection': {'dictionary': "DICT_ARUCO_MIP_36H12"}})
+
+    for numMarkers in args.markers:
+        # Detect the markers once, only the pose stage is timed
+        mask, _ = syntheticMask(numMarkers=numMarkers,
+                                markerPixels=70 if numMarkers > 4 else 120)
+        result = detector.detect(mask)
+        cornersList = list(result.corners[:, None])
+        print(f"[Info] Pose stage with {len(result)} markers")
+
+        printTimings("legacy estimatePoseSingleMarkers + loop", timeCalls(
+            lambda: legacyPoses(cornersList, markerSize), args.repeats))
+        printTimings("batched estimatePoses", timeCalls(
+            lambda: estimatePoses(result.corners, markerSize,
+                                  SYNTHETIC_CAMERA_MATRIX, DIST_COEFFS), args.repeats))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Accuracy-vs-speed benchmark of the coarse-to-fine (pyramid) detection against
+full-resolution detection, on perspective-warped synthetic masks with sub-pixel
+ground-truth corners (RealSense 1280x720 and iDS ROI 976x900 sizes).
+
+Usage: python -m benchmarks.bench_pyramid [--scenes 10]
+"""
+
+import argparse
+import numpy as np
+from src.marker_detector.arucoDetector import arucoMarkerDetector
+from benchmarks.utils import syntheticWarpedMask, timeCalls
+
+# Detection variants: (label, detection config overrides)
+VARIANTS = [
+    ("full-res", {}),
+    ("full-res + ArUco subpix", {'parameters': {'cornerRefinementMethod': 1}}),
+    ("pyramid x0.5 + subpix", {'pyramid': {'enable': True, 'scale': 0.5}}),
+    ("pyramid x0.25 + subpix", {'pyramid': {'enable': True, 'scale': 0.25}})
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scenes', type=int, default=10)
+    parser.add_argument('--markers', type=int, default=6)
+    parser.add_argument('--markerPixels', type=int, default=110)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    for width, height in [(1280, 720), (976, 900)]:
+        scenes = [syntheticWarpedMask(width, height, args.markers,
+                                      args.markerPixels, seed=seed)
+                  for seed in range(args.scenes)]
+        print(f"[Info] {args.scenes} scenes of {width}x{height} with "
+              f"{args.markers} markers of ~{args.markerPixels}px")
+
+        for label, overrides in VARIANTS:
+            detector = arucoMarkerDetector({
+                'structure': {'size': 0.163},
+                'detection': {'dictionary': "DICT_ARUCO_MIP_36H12", **overrides}})
+            durations, errors, found, total = [], [], 0, 0
+
+            for mask, groundTruth in scenes:
+                result = detector.detect(mask)
+                durations.append(np.median(timeCalls(
+                    lambda: detector.detect(mask), args.repeats, warmup=2)))
+                found += sum(id in groundTruth for id in result.ids)
+                total += len(groundTruth)
+                errors += [np.linalg.norm(corners - groundTruth[id], axis=1)
+                           for id, corners in zip(result.ids, result.corners)
+                           if id in groundTruth]
+
+            errors = np.concatenate(errors) if errors else np.array([np.nan])
+            print(f"- {label:<26} {np.mean(durations):7.3f} ms | recall: "
+                  f"{found / total * 100:5.1f}% | corner error mean: "
+                  f"{errors.mean():.3f}px, p95: {np.percentile(errors, 95):.3f}px")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Benchmark of the mask-guided ROI detection against full-frame detection on
+masks where the markers cover a small fraction of the frame.
+
+Usage: python -m benchmarks.bench_roi [--width 1280 --height 720]
+"""
+
+import argparse
+from benchmarks.utils import printTimings, syntheticMask, timeCalls
+from src.marker_detector.arucoDetector import arucoMarkerDetector
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--markers', type=int, nargs='+', default=[1, 4, 20])
+    parser.add_argument('--markerPixels', type=int, default=80)
+    parser.add_argument('--repeats', type=int, default=100)
+    args = parser.parse_args()
+
+    for numMarkers in args.markers:
+        mask, groundTruth = syntheticMask(args.width, args.height, numMarkers,
+                                          args.markerPixels)
+        coverage = len(groundTruth) * args.markerPixels ** 2 / mask.size
+        print(f"[Info] {len(groundTruth)} markers of {args.markerPixels}px "
+              f"({coverage * 100:.1f}% of a {args.width}x{args.height} mask)")
+
+        for label, enable in [("full-frame", False), ("mask-guided ROI", True)]:
+            detector = arucoMarkerDetector({
+                'structure': {'size': 0.163},
+                'detection': {'dictionary': "DICT_ARUCO_MIP_36H12",
+                              'roi': {'enable': enable}}})
+            found = len(detector.detect(mask))
+            printTimings(f"{label} ({found}/{len(groundTruth)} found)",
+                         timeCalls(lambda: detector.detect(mask), args.repeats))
+
+
+if __name__ == '__main__':
+    main()
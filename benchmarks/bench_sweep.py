@@ -0,0 +1,187 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Sweep of the detector parameters over a grid of values, reporting the latency
+percentiles and the recall of every setting (evaluated in a process pool).
+
+The inputs are the masks (or frames) of a folder, or synthetic warped masks if
+no folder is given. The recall is measured against a ground-truth JSON file
+(image file name -> list of marker ids) if given, against the synthetic ground
+truth, or otherwise against the union of the markers found by all the settings.
+
+Usage: python -m benchmarks.bench_sweep [--input masks/] [--groundTruth gt.json]
+           [--grid minMarkerPerimeterRate=0.03,0.1 markerBorderBits=1]
+           [--recallTarget 0.95] [--csv sweep.csv]
+"""
+
+import os
+import csv
+import json
+import argparse
+import itertools
+import cv2 as cv
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from src.marker_detector.arucoDetector import arucoMarkerDetector
+from benchmarks.utils import syntheticWarpedMask, timeCalls
+
+# Default grid of the detector parameters (name -> values)
+DEFAULT_GRID = {
+    'minMarkerPerimeterRate': [0.03, 0.05, 0.1],
+    'minCornerDistanceRate': [0.05, 0.1],
+    'maxErroneousBitsInBorderRate': [0.35, 0.5]
+}
+
+# Image extensions read from the input folder
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+# Images shared by the worker processes (set by `initWorker`)
+_images = []
+
+
+def parseGrid(items: list) -> dict:
+    # "name=v1,v2,..." items into a grid of parameter values
+    grid = {}
+    for item in items:
+        name, _, values = item.partition('=')
+        if not values:
+            raise ValueError(f"Invalid grid item '{item}' (expected name=v1,v2,...)")
+        grid[name] = [int(value) if value.lstrip('-').isdigit() else float(value)
+                      for value in values.split(',')]
+    return grid
+
+
+def loadImages(folder: str):
+    # Grayscale images of the folder, sorted by name (unreadable files are skipped)
+    names, images = [], []
+    for name in sorted(os.listdir(folder)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        image = cv.imread(os.path.join(folder, name), cv.IMREAD_GRAYSCALE)
+        if image is None:
+            print(f"[Warn] Could not read '{name}', skipping it ...")
+            continue
+        names.append(name)
+        images.append(image)
+    return names, images
+
+
+def initWorker(images: list):
+    # Keep the images in the worker and time single-threaded detections
+    global _images
+    _images = images
+    cv.setNumThreads(1)
+
+
+def evaluateSetting(task: tuple):
+    # Latencies and found marker ids of one setting over all the images
+    dictName, paramValues, repeats = task
+    detector = arucoMarkerDetector({
+        'structure': {'size': 0.163},
+        'detection': {'dictionary': dictName, 'parameters': paramValues,
+                      'emptyMask': {'enable': False}}})
+    durations, found = [], []
+    for image in _images:
+        found.append(set(detector.detect(image).ids.tolist()))
+        durations.append(timeCalls(lambda: detector.detect(image), repeats,
+                                   warmup=1))
+    return np.concatenate(durations), found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input', type=str, help='folder of masks or frames')
+    parser.add_argument('--groundTruth', type=str,
+                        help='JSON file mapping image names to marker ids')
+    parser.add_argument('--dictionary', type=str, default="DICT_ARUCO_MIP_36H12")
+    parser.add_argument('--grid', nargs='+', default=[],
+                        help='name=v1,v2,... (replaces the default grid)')
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--recallTarget', type=float, default=0.95)
+    parser.add_argument('--scenes', type=int, default=10,
+                        help='number of synthetic masks if no input is given')
+    parser.add_argument('--csv', type=str, help='write the table to a CSV file')
+    args = parser.parse_args()
+
+    # Inputs and their ground truth
+    groundTruth = None
+    if args.input:
+        names, images = loadImages(args.input)
+        if args.groundTruth:
+            with open(args.groundTruth, 'r') as file:
+                truth = json.load(file)
+            groundTruth = [set(truth.get(name, [])) for name in names]
+    else:
+        scenes = [syntheticWarpedMask(1280, 720, 6, 60 + 10 * (seed % 6),
+                                      args.dictionary, seed=seed)
+                  for seed in range(args.scenes)]
+        images = [mask for mask, _ in scenes]
+        groundTruth = [set(truth) for _, truth in scenes]
+    if not images:
+        print(f"[Error] No images found in '{args.input}'. Exiting ...")
+        exit(1)
+
+    # Settings of the grid
+    grid = parseGrid(args.grid) if args.grid else DEFAULT_GRID
+    settings = [dict(zip(grid, values))
+                for values in itertools.product(*grid.values())]
+    print(f"[Info] Sweeping {len(settings)} settings over {len(images)} images "
+          f"with {args.workers} workers ...")
+
+    # Evaluate the settings in a process pool
+    with ProcessPoolExecutor(args.workers, initializer=initWorker,
+                             initargs=(images,)) as executor:
+        results = list(executor.map(
+            evaluateSetting,
+            [(args.dictionary, setting, args.repeats) for setting in settings]))
+
+    # Without ground truth, use the union of the markers found by all the settings
+    if groundTruth is None:
+        groundTruth = [set().union(*(found[index] for _, found in results))
+                       for index in range(len(images))]
+    expected = sum(len(truth) for truth in groundTruth)
+
+    # Table of the settings
+    rows = []
+    for setting, (durations, found) in zip(settings, results):
+        hits = sum(len(ids & truth) for ids, truth in zip(found, groundTruth))
+        p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+        rows.append({**setting, 'p50': p50, 'p90': p90, 'p99': p99,
+                     'recall': hits / max(1, expected)})
+    rows.sort(key=lambda row: row['p50'])
+
+    # Print the table
+    header = "  ".join(f"{name:>{len(name)}}" for name in grid)
+    print(f"\n{header}  {'p50 ms':>8}  {'p90 ms':>8}  {'p99 ms':>8}  {'recall':>7}")
+    for row in rows:
+        values = "  ".join(f"{row[name]:>{len(name)}}" for name in grid)
+        print(f"{values}  {row['p50']:8.3f}  {row['p90']:8.3f}  {row['p99']:8.3f}  "
+              f"{row['recall'] * 100:6.1f}%")
+
+    # Fastest setting meeting the recall target
+    best = next((row for row in rows if row['recall'] >= args.recallTarget), None)
+    if best is None:
+        print(f"\n[Warn] No setting reaches a recall of {args.recallTarget * 100:.1f}%")
+    else:
+        print(f"\n[Info] Fastest setting with a recall >= "
+              f"{args.recallTarget * 100:.1f}%: "
+              f"{ {name: best[name] for name in grid} } ({best['p50']:.3f} ms)")
+
+    # Save the table
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[Info] Table saved to '{args.csv}'")
+
+
+if __name__ == '__main__':
+    main()
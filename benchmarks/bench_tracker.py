@@ -0,0 +1,67 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+
+Benchmark of the inter-frame marker tracker against a full detection on every
+frame, on a synthetic sequence of masks translating by a few pixels per frame.
+
+Usage: python -m benchmarks.bench_tracker [--frames 300 --interval 10]
+"""
+
+import time
+import argparse
+import cv2 as cv
+import numpy as np
+from src.marker_detector.markerTracker import markerTracker
+from src.marker_detector.arucoDetector import arucoMarkerDetector
+from benchmarks.utils import SYNTHETIC_CAMERA_MATRIX, SYNTHETIC_DIST_COEFFS, syntheticMask
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--markers', type=int, default=4)
+    parser.add_argument('--interval', type=int, default=10)
+    parser.add_argument('--speed', type=float, default=2.0,
+                        help="motion of the markers in pixels per frame")
+    args = parser.parse_args()
+
+    # Prepare a sequence of masks moving back and forth
+    mask, groundTruth = syntheticMask(numMarkers=args.markers, markerPixels=100)
+    height, width = mask.shape
+    shifts = args.speed * 20 * np.sin(np.arange(args.frames) * args.speed / 20)
+    masks = [cv.warpAffine(mask, np.float32([[1, 0, shift], [0, 1, shift / 2]]),
+                           (width, height), borderValue=255) for shift in shifts]
+    print(f"[Info] {args.frames} masks of {width}x{height} with {len(groundTruth)} moving markers")
+
+    for label, enable in [("full detection", False), ("tracking", True)]:
+        detector = arucoMarkerDetector({'structure': {'size': 0.163},
+                                        'detection': {'dictionary': "DICT_ARUCO_MIP_36H12"}})
+        tracker = markerTracker(detector, {'enable': enable,
+                                           'redetectInterval': args.interval})
+        errors, found = [], 0
+
+        # Run the sequence
+        start = time.perf_counter()
+        for index, frame in enumerate(masks):
+            result = tracker.detect(frame, SYNTHETIC_CAMERA_MATRIX,
+                                    SYNTHETIC_DIST_COEFFS)
+            found += len(result)
+            offset = np.array([shifts[index], shifts[index] / 2])
+            errors += [np.abs(corners - groundTruth[id] - offset).max()
+                       for id, corners in zip(result.ids, result.corners)]
+        elapsed = (time.perf_counter() - start) * 1000.0 / args.frames
+
+        print(f"- {label:<16} {elapsed:7.3f} ms/frame | markers found: "
+              f"{found}/{args.frames * len(groundTruth)} | max corner error: "
+              f"{max(errors):.2f}px | detected: {tracker.framesDetected}, "
+              f"tracked: {tracker.framesTracked}")
+
+
+if __name__ == '__main__':
+    main()
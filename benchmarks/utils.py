@@ -0,0 +1,194 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import time
+import cv2 as cv
+import numpy as np
+from src.marker_detector.arucoDetector import getArucoDict
+
+# Camera intrinsics used for the synthetic scenes (no distortion)
+SYNTHETIC_CAMERA_MATRIX = np.array([[600.0, 0.0, 640.0],
+                                    [0.0, 600.0, 360.0],
+                                    [0.0, 0.0, 1.0]])
+SYNTHETIC_DIST_COEFFS = np.zeros((5, 1))
+
+
+def syntheticMask(width: int = 1280, height: int = 720, numMarkers: int = 4,
+                  markerPixels: int = 120, dictName: str = "DICT_ARUCO_MIP_36H12",
+                  seed: int = 0):
+    """
+    Generates a binary iMarker-like mask with revealed markers on a white background.
+
+    Parameters
+    ----------
+    width: int
+        Width of the mask in pixels.
+    height: int
+        Height of the mask in pixels.
+    numMarkers: int
+        Number of markers to place (on a grid, without overlaps).
+    markerPixels: int
+        Side length of each marker in pixels (without its white quiet zone).
+    dictName: str
+        Name of the Aruco dictionary the markers are drawn from.
+    seed: int
+        Seed of the random generator picking marker ids and jitter.
+
+    Returns
+    -------
+    mask: numpy.ndarray
+        Single-channel uint8 mask.
+    groundTruth: dict
+        Marker ids mapped to their (4, 2) float32 corners in pixels.
+    """
+    # Variables
+    rng = np.random.default_rng(seed)
+    dictionary = getArucoDict(dictName)
+    mask = np.full((height, width), 255, dtype=np.uint8)
+    quietZone = markerPixels // 4
+    cellSize = markerPixels + 3 * quietZone
+    cols = max(1, width // cellSize)
+    rows = max(1, height // cellSize)
+    markerIds = rng.choice(len(dictionary.bytesList),
+                           size=min(numMarkers, rows * cols), replace=False)
+    groundTruth = {}
+
+    # Draw the markers on their grid cells
+    for index, markerId in enumerate(markerIds):
+        row, col = divmod(index, cols)
+        x = col * cellSize + quietZone + int(rng.integers(0, quietZone + 1))
+        y = row * cellSize + quietZone + int(rng.integers(0, quietZone + 1))
+        marker = cv.aruco.generateImageMarker(
+            dictionary, int(markerId), markerPixels)
+        mask[y:y + markerPixels, x:x + markerPixels] = marker
+        groundTruth[int(markerId)] = np.array(
+            [[x, y], [x + markerPixels, y], [x + markerPixels, y + markerPixels],
+             [x, y + markerPixels]], dtype=np.float32)
+
+    # Return
+    return mask, groundTruth
+
+
+def timeCalls(function, repeats: int = 200, warmup: int = 10) -> np.ndarray:
+    """
+    Times repeated calls of a function.
+
+    Parameters
+    ----------
+    function: callable
+        Function (without arguments) to time.
+    repeats: int
+        Number of timed calls.
+    warmup: int
+        Number of untimed calls made beforehand.
+
+    Returns
+    -------
+    durations: numpy.ndarray
+        Duration of each call in milliseconds.
+    """
+    # Warm up caches and lazy initializations
+    for _ in range(warmup):
+        function()
+
+    # Time the calls
+    durations = np.empty(repeats)
+    for index in range(repeats):
+        start = time.perf_counter()
+        function()
+        durations[index] = (time.perf_counter() - start) * 1000.0
+
+    # Return
+    return durations
+
+
+def printTimings(label: str, durations: np.ndarray):
+    """
+    Prints the median and percentiles of the given durations.
+
+    Parameters
+    ----------
+    label: str
+        Label of the measured variant.
+    durations: numpy.ndarray
+        Durations in milliseconds.
+    """
+    p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+    print(f"- {label:<40} p50: {p50:8.3f} ms | p90: {p90:8.3f} ms | p99: {p99:8.3f} ms")
+
+
+def syntheticWarpedMask(width: int = 1280, height: int = 720, numMarkers: int = 4,
+                        markerPixels: int = 120, dictName: str = "DICT_ARUCO_MIP_36H12",
+                        seed: int = 0):
+    """
+    Generates a binary mask with perspective-warped markers on a white background,
+    with sub-pixel ground-truth corners (useful to measure the corner accuracy).
+
+    Parameters
+    ----------
+    width: int
+        Width of the mask in pixels.
+    height: int
+        Height of the mask in pixels.
+    numMarkers: int
+        Number of markers to place (on a grid, without overlaps).
+    markerPixels: int
+        Approximate side length of each marker in pixels.
+    dictName: str
+        Name of the Aruco dictionary the markers are drawn from.
+    seed: int
+        Seed of the random generator picking marker ids and perspective jitter.
+
+    Returns
+    -------
+    mask: numpy.ndarray
+        Single-channel uint8 mask.
+    groundTruth: dict
+        Marker ids mapped to their (4, 2) float32 corners in pixels.
+    """
+    # Variables
+    rng = np.random.default_rng(seed)
+    dictionary = getArucoDict(dictName)
+    mask = np.full((height, width), 255, dtype=np.float32)
+    sourceSize = 400
+    sourceOnes = np.ones((sourceSize, sourceSize), dtype=np.float32)
+    cellSize = int(markerPixels * 1.8)
+    cols = max(1, width // cellSize)
+    rows = max(1, height // cellSize)
+    markerIds = rng.choice(len(dictionary.bytesList),
+                           size=min(numMarkers, rows * cols), replace=False)
+    # Edges of the source marker (pixel-center coordinates)
+    sourceCorners = np.array([[-0.5, -0.5], [sourceSize - 0.5, -0.5],
+                              [sourceSize - 0.5, sourceSize - 0.5],
+                              [-0.5, sourceSize - 0.5]], dtype=np.float32)
+    groundTruth = {}
+
+    for index, markerId in enumerate(markerIds):
+        # Jittered target quad inside its grid cell
+        row, col = divmod(index, cols)
+        origin = np.array([col * cellSize, row * cellSize]) + 0.4 * markerPixels
+        square = np.array([[0, 0], [1, 0], [1, 1], [0, 1]]) * markerPixels
+        quad = (origin + square + rng.uniform(-0.12, 0.12, (4, 2)) *
+                markerPixels).astype(np.float32)
+
+        # Warp the marker and its coverage, and blend them into the mask
+        marker = cv.aruco.generateImageMarker(dictionary, int(markerId),
+                                              sourceSize).astype(np.float32)
+        homography = cv.getPerspectiveTransform(sourceCorners, quad)
+        warped = cv.warpPerspective(marker, homography, (width, height))
+        coverage = cv.warpPerspective(sourceOnes, homography, (width, height))
+        mask = mask * (1.0 - coverage) + warped
+        groundTruth[int(markerId)] = quad
+
+    # Binarize (as the iMarker masks are binary)
+    mask = np.where(mask > 127, 255, 0).astype(np.uint8)
+
+    # Return
+    return mask, groundTruth
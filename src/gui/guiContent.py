@@ -3,6 +3,22 @@ import numpy as np
 import dearpygui.dearpygui as dpg
 from src.gui.utils import hsvToRgbHex, hsvToRgbTuple
 
+# RGBA buffers (uint8 and float32) of the dynamic textures, per texture tag
+textureBuffers = {}
+
+# Downscaled (preview) frames of the dynamic textures, per texture tag
+previewBuffers = {}
+
+# Image tabs: tab tag -> (shown image, texture tag)
+TAB_TEXTURES = {
+    'RawFrameLeftTab': ('left', 'FramesLeft'),
+    'RawFrameRightTab': ('right', 'FramesRight'),
+    'RawFrameTab': ('main', 'FramesMain'),
+    'MaskFrameTab': ('mask', 'FramesMask'),
+    'MaskAppliedTab': ('maskApplied', 'FramesMaskApplied'),
+    'MarkersTab': ('marker', 'FramesMarker'),
+}
+
 
 def guiElements(cfg: dict, singleCamera: bool = False):
     """
@@ -128,44 +144,27 @@ def guiElements(cfg: dict, singleCamera: bool = False):
             with dpg.tab_bar(tag="ImageTabBar"):
                 if singleCamera:
                     if isUV:
-                        with dpg.tab(label="Raw Frame", tag="RawFrameTab"):
-                            dpg.add_image("FramesMain")
-                        with dpg.tab(label="Mask Frame", tag="MaskFrameTab"):
-                            dpg.add_image("FramesMask")
-                        with dpg.tab(label="Mask Applied", tag="MaskAppliedTab"):
-                            dpg.add_image("FramesMaskApplied")
-                        with dpg.tab(label="Detected Markers", tag="MarkersTab"):
-                            dpg.add_image("FramesMarker")
+                        dpg.add_tab(label="Raw Frame", tag="RawFrameTab")
+                        dpg.add_tab(label="Mask Frame", tag="MaskFrameTab")
+                        dpg.add_tab(label="Mask Applied", tag="MaskAppliedTab")
+                        dpg.add_tab(label="Detected Markers", tag="MarkersTab")
                     else:
                         if isSequential:
-                            with dpg.tab(label="Previous Frame", tag="RawFrameLeftTab"):
-                                dpg.add_image("FramesLeft")
-                            with dpg.tab(label="Current Frame", tag="RawFrameRightTab"):
-                                dpg.add_image("FramesRight")
-                            with dpg.tab(label="Mask Frame", tag="MaskFrameTab"):
-                                dpg.add_image("FramesMask")
-                            with dpg.tab(label="Mask Applied", tag="MaskAppliedTab"):
-                                dpg.add_image("FramesMaskApplied")
-                            with dpg.tab(label="Detected Markers", tag="MarkersTab"):
-                                dpg.add_image("FramesMarker")
+                            dpg.add_tab(label="Previous Frame", tag="RawFrameLeftTab")
+                            dpg.add_tab(label="Current Frame", tag="RawFrameRightTab")
+                            dpg.add_tab(label="Mask Frame", tag="MaskFrameTab")
+                            dpg.add_tab(label="Mask Applied", tag="MaskAppliedTab")
+                            dpg.add_tab(label="Detected Markers", tag="MarkersTab")
                         else:
-                            with dpg.tab(label="Raw Frame", tag="RawFrameTab"):
-                                dpg.add_image("FramesMain")
-                            with dpg.tab(label="Mask Frame", tag="MaskFrameTab"):
-                                dpg.add_image("FramesMask")
-                            with dpg.tab(label="Mask Applied", tag="MaskAppliedTab"):
-                                dpg.add_image("FramesMaskApplied")
-                            with dpg.tab(label="Detected Markers", tag="MarkersTab"):
-                                dpg.add_image("FramesMarker")
+                            dpg.add_tab(label="Raw Frame", tag="RawFrameTab")
+                            dpg.add_tab(label="Mask Frame", tag="MaskFrameTab")
+                            dpg.add_tab(label="Mask Applied", tag="MaskAppliedTab")
+                            dpg.add_tab(label="Detected Markers", tag="MarkersTab")
                 else:
-                    with dpg.tab(label="Raw Frame Left", tag="RawFrameLeftTab"):
-                        dpg.add_image("FramesLeft")
-                    with dpg.tab(label="Raw Frame Right", tag="RawFrameRightTab"):
-                        dpg.add_image("FramesRight")
-                    with dpg.tab(label="Mask Frame", tag="MaskFrameTab"):
-                        dpg.add_image("FramesMask")
-                    with dpg.tab(label="Detected Markers", tag="MarkersTab"):
-                        dpg.add_image("FramesMarker")
+                    dpg.add_tab(label="Raw Frame Left", tag="RawFrameLeftTab")
+                    dpg.add_tab(label="Raw Frame Right", tag="RawFrameRightTab")
+                    dpg.add_tab(label="Mask Frame", tag="MaskFrameTab")
+                    dpg.add_tab(label="Detected Markers", tag="MarkersTab")
 
         # Footer
         with dpg.group(horizontal=True):
@@ -207,47 +206,85 @@ def loadImageAsTexture(path: str, tag: str):
 
     height, width, _ = img.shape
     # Normalize to 0–1 float
-    img = img.astype(np.float32) / 255.0
-    # Flatten row-major
-    imgData = img.flatten()
+    img = np.multiply(img, np.float32(1.0 / 255.0), dtype=np.float32)
+    # Flatten row-major (a view, handed to DPG as is)
+    imgData = img.reshape(-1)
 
     with dpg.texture_registry():
         dpg.add_static_texture(width, height, imgData, tag=tag)
 
 
-def updateImageTexture(frame: np.ndarray, tag: str):
+def updateImageTexture(frame: np.ndarray, tag: str, parent: str = None, maxWidth: int = 0):
     """
     Converts an OpenCV BGR/BGRA image to RGBA float32 format and updates the DPG texture.
+    The conversions are written in-place into buffers kept per texture, which are
+    handed to DPG directly (no per-frame allocation nor Python list). The texture
+    is created the first time it is updated (and again if the frame size changes).
 
     Parameters
     ----------
     frame : np.ndarray
         The image to display (BGR or BGRA format).
     tag : str
-        The texture tag to update (must be registered in dpg.texture_registry).
+        The texture tag to update (created in the "FrameTextures" registry).
+    parent : str, optional
+        The tag of the item (e.g., tab) showing the texture, when it is created.
+    maxWidth : int, optional
+        The maximum width of the displayed image (0 for the frame width).
     """
-    width, height = frame.shape[1], frame.shape[0]
-    # Convert to RGBA
+    # Downscale to the display resolution (into a buffer kept per texture)
+    height, width = frame.shape[:2]
+    if maxWidth and width > maxWidth:
+        size = (maxWidth, round(height * maxWidth / width))
+        shape = (size[1], size[0]) + frame.shape[2:]
+        preview = previewBuffers.get(tag)
+        if preview is None or preview.shape != shape or preview.dtype != frame.dtype:
+            preview = np.empty(shape, frame.dtype)
+            previewBuffers[tag] = preview
+        cv.resize(frame, size, dst=preview, interpolation=cv.INTER_AREA)
+        frame = preview
+
+    # Conversion to RGBA
     if len(frame.shape) == 2:  # Grayscale
-        frame = cv.cvtColor(frame, cv.COLOR_GRAY2RGBA)
+        conversion = cv.COLOR_GRAY2RGBA
     elif frame.shape[2] == 3:  # BGR
-        frame = cv.cvtColor(frame, cv.COLOR_BGR2RGBA)
+        conversion = cv.COLOR_BGR2RGBA
     elif frame.shape[2] == 4:  # BGRA
-        frame = cv.cvtColor(frame, cv.COLOR_BGRA2RGBA)
+        conversion = cv.COLOR_BGRA2RGBA
     else:
         raise ValueError("Unsupported image format!")
 
-    # Normalize to [0.0, 1.0]
-    frame = frame.astype(np.float32) / 255.0
-
-    # Make sure it's (H, W, 4)
-    assert frame.shape[2] == 4, f"Expected 4 channels, got {frame.shape[2]}"
-
-    # Convert to 1D list (flatten row-major)
-    flat_frame = frame.astype(np.float32).reshape(-1).tolist()
+    # Get the buffers of the texture (re-allocated only if the size changes)
+    height, width = frame.shape[:2]
+    buffers = textureBuffers.get(tag)
+    isNew = buffers is None or buffers[0].shape[:2] != (height, width) \
+        or not dpg.does_item_exist(tag)
+    if isNew:
+        buffers = (np.empty((height, width, 4), np.uint8),
+                   np.empty((height, width, 4), np.float32))
+        textureBuffers[tag] = buffers
+    rgbaFrame, textureData = buffers
+
+    # Convert to RGBA and normalize to [0.0, 1.0]
+    cv.cvtColor(frame, conversion, dst=rgbaFrame)
+    np.multiply(rgbaFrame, np.float32(1.0 / 255.0), out=textureData)
 
     try:
-        dpg.set_value(tag, flat_frame)
+        if not isNew:
+            dpg.set_value(tag, textureData.reshape(-1))
+            return
+
+        # (Re-)create the texture and the image showing it
+        imageTag = f"{tag}Image"
+        if dpg.does_item_exist(imageTag):
+            parent = dpg.get_item_parent(imageTag)
+            dpg.delete_item(imageTag)
+        if dpg.does_item_exist(tag):
+            dpg.delete_item(tag)
+        dpg.add_dynamic_texture(width, height, textureData.reshape(-1),
+                                tag=tag, parent="FrameTextures")
+        if parent is not None:
+            dpg.add_image(tag, tag=imageTag, parent=parent)
     except Exception as e:
         print(f"[ERROR] Failed to update texture: {e}")
 
@@ -284,20 +321,21 @@ def onRecord():
     dpg.set_value("RecordFlag", True)
 
 
-def onImageViewTabChange(imageDict):
-    # Update the displayed images
+def activeTabImage():
+    # The image shown by the active tab (None if there is none)
+    activeTabTag = dpg.get_item_alias(dpg.get_value("ImageTabBar"))
+    return TAB_TEXTURES[activeTabTag][0] if activeTabTag in TAB_TEXTURES else None
+
+
+def onImageViewTabChange(imageDict, maxWidth: int = 0) -> bool:
+    # Update the displayed image (only the one of the active tab), returning
+    # whether it was available
     activeTabId = dpg.get_value("ImageTabBar")
     activeTabTag = dpg.get_item_alias(activeTabId)
-    # Only update the image if the tab is changed
-    if activeTabTag == "RawFrameLeftTab":
-        updateImageTexture(imageDict['left'], 'FramesLeft')
-    elif activeTabTag == "RawFrameRightTab":
-        updateImageTexture(imageDict['right'], 'FramesRight')
-    elif activeTabTag == "RawFrameTab":
-        updateImageTexture(imageDict['main'], 'FramesMain')
-    elif activeTabTag == "MaskFrameTab":
-        updateImageTexture(imageDict['mask'], 'FramesMask')
-    elif activeTabTag == "MaskAppliedTab":
-        updateImageTexture(imageDict['maskApplied'], 'FramesMaskApplied')
-    elif activeTabTag == "MarkersTab":
-        updateImageTexture(imageDict['marker'], 'FramesMarker')
+    if activeTabTag not in TAB_TEXTURES:
+        return True
+    imageKey, textureTag = TAB_TEXTURES[activeTabTag]
+    if imageKey not in imageDict:
+        return False
+    updateImageTexture(imageDict[imageKey], textureTag, activeTabTag, maxWidth)
+    return True
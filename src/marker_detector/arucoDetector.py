@@ -8,10 +8,304 @@
 You may not use this file except in compliance with the License.
 """
 
+import time
 import cv2 as cv
 import numpy as np
 
 
+# Predefined ArUco dictionaries supported by the detector
+ARUCO_DICTS = {
+    "DICT_4X4_50": cv.aruco.DICT_4X4_50,
+    "DICT_4X4_100": cv.aruco.DICT_4X4_100,
+    "DICT_4X4_250": cv.aruco.DICT_4X4_250,
+    "DICT_4X4_1000": cv.aruco.DICT_4X4_1000,
+    "DICT_5X5_50": cv.aruco.DICT_5X5_50,
+    "DICT_5X5_100": cv.aruco.DICT_5X5_100,
+    "DICT_5X5_250": cv.aruco.DICT_5X5_250,
+    "DICT_5X5_1000": cv.aruco.DICT_5X5_1000,
+    "DICT_6X6_50": cv.aruco.DICT_6X6_50,
+    "DICT_6X6_100": cv.aruco.DICT_6X6_100,
+    "DICT_6X6_250": cv.aruco.DICT_6X6_250,
+    "DICT_6X6_1000": cv.aruco.DICT_6X6_1000,
+    "DICT_7X7_50": cv.aruco.DICT_7X7_50,
+    "DICT_7X7_100": cv.aruco.DICT_7X7_100,
+    "DICT_7X7_250": cv.aruco.DICT_7X7_250,
+    "DICT_7X7_1000": cv.aruco.DICT_7X7_1000,
+    "DICT_ARUCO_ORIGINAL": cv.aruco.DICT_ARUCO_ORIGINAL,
+    "DICT_APRILTAG_16h5": cv.aruco.DICT_APRILTAG_16h5,
+    "DICT_APRILTAG_25h9": cv.aruco.DICT_APRILTAG_25h9,
+    "DICT_APRILTAG_36h10": cv.aruco.DICT_APRILTAG_36h10,
+    "DICT_APRILTAG_36h11": cv.aruco.DICT_APRILTAG_36h11,
+    "DICT_ARUCO_MIP_36H12": cv.aruco.DICT_ARUCO_MIP_36H12
+}
+
+# Default detector parameters (overridable via `marker.detection.parameters`)
+DEFAULT_DETECTOR_PARAMS = {
+    # Minimum size of a marker in relation to image size (default: 0.03)
+    "minMarkerPerimeterRate": 0.1,
+    # Minimum distance between corners (default: 0.05)
+    "minCornerDistanceRate": 0.05,
+    # Maximum error when detecting marker corners (default: 0.35)
+    "maxErroneousBitsInBorderRate": 0.35
+}
+
+# Default mask-guided ROI detection settings (overridable via `marker.detection.roi`)
+DEFAULT_ROI_PARAMS = {
+    # Run the detection only inside the regions revealed by the mask
+    "enable": False,
+    # Minimum side length of a region (in pixels) to be kept
+    "minSize": 20,
+    # Padding (in pixels) added around each region before cropping
+    "padding": 16,
+    # Factor by which the mask is shrunk to find the regions
+    "downscale": 4,
+    # Fall back to full-frame detection above this fraction of the frame area
+    "maxCoverage": 0.5
+}
+
+# Default empty-mask pre-check settings (overridable via `marker.detection.emptyMask`)
+DEFAULT_EMPTY_MASK_PARAMS = {
+    # Skip the detection when the mask is (almost) uniform
+    "enable": True,
+    # Minimum fraction of minority pixels for the mask to be considered non-empty
+    # (None: derived from the smallest detectable marker, see `minMaskRatio`)
+    "minRatio": None,
+    # Share of the smallest detectable marker expected to be minority pixels
+    "markerShare": 0.1,
+    # Shrink factor (area averaging) of the mask when counting the pixels
+    "downscale": 8
+}
+
+# Default coarse-to-fine settings (overridable via `marker.detection.pyramid`)
+DEFAULT_PYRAMID_PARAMS = {
+    # Detect on a downscaled copy and refine the corners at full resolution
+    "enable": False,
+    # Scale of the coarse copy
+    "scale": 0.5,
+    # Half size (in pixels) of the sub-pixel refinement window
+    "refineWindow": 4
+}
+
+# Termination criteria of the sub-pixel corner refinement
+_SUBPIX_CRITERIA = (cv.TERM_CRITERIA_EPS | cv.TERM_CRITERIA_COUNT, 30, 0.01)
+
+# Identity intrinsics used when solving poses on undistorted (normalized) points
+_IDENTITY_CAMERA_MATRIX = np.eye(3)
+_NO_DIST_COEFFS = np.zeros((4, 1))
+
+# Object points of square markers, cached per marker size
+_markerObjectPoints = {}
+
+
+def getMarkerObjectPoints(markerSize: float) -> np.ndarray:
+    """
+    Returns the corners of a square marker in its own frame, ordered as
+    required by `cv.SOLVEPNP_IPPE_SQUARE` (computed once per marker size).
+
+    Parameters
+    ----------
+    markerSize: float
+        Size of the markers in meters.
+
+    Returns
+    -------
+    objectPoints: numpy.ndarray
+        (4, 3) float64 array of the marker corners.
+    """
+    objectPoints = _markerObjectPoints.get(markerSize)
+    if objectPoints is None:
+        half = markerSize / 2.0
+        objectPoints = np.array([[-half, half, 0.0], [half, half, 0.0],
+                                 [half, -half, 0.0], [-half, -half, 0.0]])
+        _markerObjectPoints[markerSize] = objectPoints
+    return objectPoints
+
+
+def estimatePoses(corners: np.ndarray, markerSize: float, cameraMatrix,
+                  distCoeffs):
+    """
+    Estimates the poses of all the markers of a frame in one batch.
+
+    The corners of all the markers are undistorted with a single call, so each
+    per-marker IPPE-square solve runs on normalized points without a distortion
+    model, and the distances are computed with one vectorized call.
+
+    Parameters
+    ----------
+    corners: numpy.ndarray
+        (N, 4, 2) float32 array of marker corners in pixels.
+    markerSize: float
+        Size of the markers in meters.
+    cameraMatrix: numpy.ndarray
+        Camera matrix of the camera.
+    distCoeffs: numpy.ndarray
+        Distortion coefficients of the camera.
+
+    Returns
+    -------
+    rvecs: numpy.ndarray
+        (N, 3) rotation vectors.
+    tvecs: numpy.ndarray
+        (N, 3) translation vectors in meters.
+    distances: numpy.ndarray
+        (N,) distances of the markers from the camera in meters.
+    """
+    # Variables
+    numMarkers = len(corners)
+    rvecs = np.zeros((numMarkers, 3))
+    tvecs = np.zeros((numMarkers, 3))
+    objectPoints = getMarkerObjectPoints(markerSize)
+
+    # Undistort the corners of all the markers at once
+    normalized = cv.undistortPoints(
+        corners.reshape(-1, 1, 2).astype(np.float64), cameraMatrix,
+        distCoeffs).reshape(numMarkers, 4, 2)
+
+    # Solve the poses on the normalized points
+    for index in range(numMarkers):
+        _, rvec, tvec = cv.solvePnP(objectPoints, normalized[index],
+                                    _IDENTITY_CAMERA_MATRIX, _NO_DIST_COEFFS,
+                                    flags=cv.SOLVEPNP_IPPE_SQUARE)
+        rvecs[index] = rvec.ravel()
+        tvecs[index] = tvec.ravel()
+
+    # Calculate the distances (magnitude of the translation vectors)
+    distances = np.linalg.norm(tvecs, axis=1)
+
+    # Return
+    return rvecs, tvecs, distances
+
+
+def findMaskRegions(mask, minSize: int, padding: int, downscale: int = 1) -> list:
+    """
+    Finds the padded bounding boxes of the regions revealed in a binary mask.
+
+    The foreground is taken as the minority value of the mask, so the boxes
+    enclose the markers regardless of the polarity (inverted or not) of the mask.
+    Overlapping boxes are merged, so no marker is split across two crops.
+
+    Parameters
+    ----------
+    mask: numpy.ndarray
+        Single-channel binary mask.
+    minSize: int
+        Minimum side length of a region (in pixels) to be kept.
+    padding: int
+        Padding (in pixels) added around each region.
+    downscale: int, optional (default=1)
+        Factor by which the mask is shrunk before labelling the components.
+
+    Returns
+    -------
+    boxes: list
+        List of (x0, y0, x1, y1) boxes in full-resolution pixels, clipped to the mask.
+    """
+    # Variables
+    height, width = mask.shape[:2]
+    boxes = []
+
+    # Take the minority value as the foreground
+    foreground = mask
+    if cv.countNonZero(mask) > (height * width) // 2:
+        foreground = cv.bitwise_not(mask)
+
+    # Shrink the mask, keeping any block that contains foreground
+    if downscale > 1:
+        foreground = cv.resize(foreground, (width // downscale, height // downscale),
+                               interpolation=cv.INTER_AREA)
+
+    # Extract the connected components
+    _, _, stats, _ = cv.connectedComponentsWithStats(foreground, connectivity=8)
+
+    # Keep the large-enough components (label 0 is the background)
+    for x, y, w, h, _ in stats[1:] * downscale:
+        if w < minSize or h < minSize:
+            continue
+        boxes.append([max(0, x - padding), max(0, y - padding),
+                      min(width, x + w + padding), min(height, y + h + padding)])
+
+    # Merge the overlapping boxes until none overlap
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(boxes)):
+            for j in range(i + 1, len(boxes)):
+                a, b = boxes[i], boxes[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    boxes[i] = [min(a[0], b[0]), min(a[1], b[1]),
+                                max(a[2], b[2]), max(a[3], b[3])]
+                    del boxes[j]
+                    merged = True
+                    break
+            if merged:
+                break
+
+    # Return
+    return [tuple(int(value) for value in box) for box in boxes]
+
+
+def minMaskRatio(shape: tuple, minPerimeterRate: float, markerShare: float) -> float:
+    """
+    Returns the fraction of minority pixels of a mask showing the smallest marker
+    the detector can find (side of `minPerimeterRate` times the largest frame
+    side, divided by 4), of which only `markerShare` is assumed to be minority
+    pixels to stay on the safe side.
+
+    Parameters
+    ----------
+    shape: tuple
+        Shape of the mask.
+    minPerimeterRate: float
+        The `minMarkerPerimeterRate` of the detector parameters.
+    markerShare: float
+        Share of the marker area expected to be minority pixels.
+
+    Returns
+    -------
+    minRatio: float
+        Minimum fraction of minority pixels for the mask to be considered non-empty.
+    """
+    height, width = shape[:2]
+    minSide = minPerimeterRate * max(height, width) / 4.0
+    return markerShare * minSide * minSide / (height * width)
+
+
+def isMaskEmpty(mask, minRatio: float, downscale: int = 1) -> bool:
+    """
+    Checks whether a binary mask is (almost) uniform, i.e., reveals no marker.
+
+    The pixels are counted on an area-averaged (downsampled) copy of the mask,
+    which keeps the exact share of the pixels whatever the sampling, and both an
+    all-black and an all-white mask are considered empty.
+
+    Parameters
+    ----------
+    mask: numpy.ndarray
+        Binary 0/255 mask (single-channel, or three identical channels).
+    minRatio: float
+        Minimum fraction of minority pixels for the mask to be considered non-empty.
+    downscale: int, optional (default=1)
+        Shrink factor of the mask.
+
+    Returns
+    -------
+    isEmpty: bool
+        Whether the mask is (almost) uniform.
+    """
+    # Shrink the mask (area averaging, no pixel is skipped)
+    if mask.ndim == 3:
+        mask = mask[:, :, 0]
+    if downscale > 1:
+        mask = cv.resize(mask, None, fx=1.0 / downscale, fy=1.0 / downscale,
+                         interpolation=cv.INTER_AREA)
+
+    # Ratio of the white pixels
+    ratio = cv.mean(mask)[0] / 255.0
+
+    # Return
+    return ratio < minRatio or ratio > 1.0 - minRatio
+
+
 def getArucoDict(dictName: str) -> cv.aruco.Dictionary:
     """
     Returns the Aruco dictionary object corresponding to the given name.
@@ -26,34 +320,8 @@ def getArucoDict(dictName: str) -> cv.aruco.Dictionary:
     dictionary: cv.aruco.Dictionary
         Aruco dictionary object.
     """
-    # Variables
-    arucoDicts = {
-        "DICT_4X4_50": cv.aruco.DICT_4X4_50,
-        "DICT_4X4_100": cv.aruco.DICT_4X4_100,
-        "DICT_4X4_250": cv.aruco.DICT_4X4_250,
-        "DICT_4X4_1000": cv.aruco.DICT_4X4_1000,
-        "DICT_5X5_50": cv.aruco.DICT_5X5_50,
-        "DICT_5X5_100": cv.aruco.DICT_5X5_100,
-        "DICT_5X5_250": cv.aruco.DICT_5X5_250,
-        "DICT_5X5_1000": cv.aruco.DICT_5X5_1000,
-        "DICT_6X6_50": cv.aruco.DICT_6X6_50,
-        "DICT_6X6_100": cv.aruco.DICT_6X6_100,
-        "DICT_6X6_250": cv.aruco.DICT_6X6_250,
-        "DICT_6X6_1000": cv.aruco.DICT_6X6_1000,
-        "DICT_7X7_50": cv.aruco.DICT_7X7_50,
-        "DICT_7X7_100": cv.aruco.DICT_7X7_100,
-        "DICT_7X7_250": cv.aruco.DICT_7X7_250,
-        "DICT_7X7_1000": cv.aruco.DICT_7X7_1000,
-        "DICT_ARUCO_ORIGINAL": cv.aruco.DICT_ARUCO_ORIGINAL,
-        "DICT_APRILTAG_16h5": cv.aruco.DICT_APRILTAG_16h5,
-        "DICT_APRILTAG_25h9": cv.aruco.DICT_APRILTAG_25h9,
-        "DICT_APRILTAG_36h10": cv.aruco.DICT_APRILTAG_36h10,
-        "DICT_APRILTAG_36h11": cv.aruco.DICT_APRILTAG_36h11,
-        "DICT_ARUCO_MIP_36H12": cv.aruco.DICT_ARUCO_MIP_36H12
-    }
-
     # Get the corresponding dictionary constant
-    dictConstant = arucoDicts.get(dictName, None)
+    dictConstant = ARUCO_DICTS.get(dictName, None)
     if dictConstant is None:
         raise ValueError(f"Aruco dictionary '{dictName}' is not recognized.")
 
@@ -61,72 +329,569 @@ def getArucoDict(dictName: str) -> cv.aruco.Dictionary:
     return cv.aruco.getPredefinedDictionary(dictConstant)
 
 
-def arucoDetector(frame, cameraMatrix, distCoeffs, arucoDict: str,
-                  markerSize: float):
+def getDetectorParams(paramValues: dict = None) -> cv.aruco.DetectorParameters:
     """
-    Detects the markers in the frame and returns the frame with the detected markers.
+    Creates the detector parameters, overriding the defaults with the given values.
 
     Parameters
     ----------
-    frame: numpy.ndarray
-        Frame to detect the markers in.
-    cameraMatrix: numpy.ndarray
-        Camera matrix of the camera.
-    distCoeffs: numpy.ndarray
-        Distortion coefficients of the camera.
-    arucoDict: str
-        Aruco dictionary to use for marker detection.
-    markerSize: float
-        Size of the markers to detect in meters.        
+    paramValues: dict, optional
+        Values of `cv.aruco.DetectorParameters` attributes to override.
 
     Returns
     -------
-    frame: numpy.ndarray
-        Frame with detected markers.
+    parameters: cv.aruco.DetectorParameters
+        Detector parameters object.
     """
     # Variables
-    dictionary = getArucoDict(arucoDict)
     parameters = cv.aruco.DetectorParameters()
-    rotationVecs, translationVecs = None, None
+    values = {**DEFAULT_DETECTOR_PARAMS, **(paramValues or {})}
 
-    # Minimum size of a marker in relation to image size (default: 0.03)
-    parameters.minMarkerPerimeterRate = 0.1
-    # Minimum distance between corners (default: 0.05)
-    parameters.minCornerDistanceRate = 0.05
-    # Maximum error when detecting marker corners (default: 0.35)
-    parameters.maxErroneousBitsInBorderRate = 0.35
+    # Set the values
+    for name, value in values.items():
+        if not hasattr(parameters, name):
+            raise ValueError(f"Detector parameter '{name}' is not recognized.")
+        setattr(parameters, name, value)
 
-    # Detect the markers
-    corners, ids, _ = cv.aruco.detectMarkers(
-        frame, dictionary, parameters=parameters)
+    # Return the parameters
+    return parameters
 
-    # If markers are detected
-    if ids is not None:
-        # Draw the detected markers
-        cv.aruco.drawDetectedMarkers(frame, corners, ids)
 
-        # If camera matrix and distortion coefficients are not provided, just draw the markers
+def decodeCandidate(gray, candidate, dictionary: cv.aruco.Dictionary,
+                    parameters: cv.aruco.DetectorParameters):
+    """
+    Decodes a candidate quad (e.g., rejected by a detector built for another
+    dictionary) against the given dictionary, following the bit extraction of
+    `cv.aruco.ArucoDetector` (perspective removal, Otsu, border check).
+
+    Parameters
+    ----------
+    gray: numpy.ndarray
+        Single-channel image the candidate was found in.
+    candidate: numpy.ndarray
+        (4, 2) float32 corners of the candidate (clockwise).
+    dictionary: cv.aruco.Dictionary
+        Dictionary to decode the candidate against.
+    parameters: cv.aruco.DetectorParameters
+        Detector parameters (border bits, sampling and error rates).
+
+    Returns
+    -------
+    decoded: tuple or None
+        (corners, id) with the corners rotated to the marker orientation, or
+        None if the candidate is not a marker of this dictionary.
+    """
+    # Variables
+    markerBits = dictionary.markerSize
+    borderBits = parameters.markerBorderBits
+    cells = markerBits + 2 * borderBits
+    cellPixels = parameters.perspectiveRemovePixelPerCell
+    margin = int(cellPixels * parameters.perspectiveRemoveIgnoredMarginPerCell)
+    side = cells * cellPixels
+
+    # Remove the perspective of the candidate
+    target = np.array([[0, 0], [side - 1, 0], [side - 1, side - 1], [0, side - 1]],
+                      dtype=np.float32)
+    homography = cv.getPerspectiveTransform(candidate, target)
+    warped = cv.warpPerspective(gray, homography, (side, side),
+                                flags=cv.INTER_NEAREST)
+
+    # A marker has both black and white cells
+    if warped.std() < parameters.minOtsuStdDev:
+        return None
+
+    # Sample the bits of every cell
+    _, binary = cv.threshold(warped, 0, 1, cv.THRESH_BINARY | cv.THRESH_OTSU)
+    cellsView = binary.reshape(cells, cellPixels, cells, cellPixels)[
+        :, margin:cellPixels - margin, :, margin:cellPixels - margin]
+    bits = (cellsView.mean(axis=(1, 3)) > 0.5).astype(np.uint8)
+
+    # The border should be black
+    innerBits = bits[borderBits:cells - borderBits, borderBits:cells - borderBits]
+    borderErrors = int(bits.sum()) - int(innerBits.sum())
+    if borderErrors > int(markerBits * markerBits * parameters.maxErroneousBitsInBorderRate):
+        return None
+
+    # Identify the marker
+    isMarker, markerId, rotation = dictionary.identify(
+        innerBits, parameters.errorCorrectionRate)
+    if not isMarker:
+        return None
+
+    # Return (with the first corner being the top-left corner of the marker)
+    return np.roll(candidate, rotation, axis=0), markerId
+
+
+def _noMarkers():
+    # Empty (corners, ids, dictIndices) triplet
+    return np.empty((0, 4, 2), dtype=np.float32), np.empty((0,), dtype=np.int32), \
+        np.empty((0,), dtype=np.int32)
+
+
+class detectionResult:
+    """
+    Compact record of the markers detected in a single frame.
+
+    Attributes
+    ----------
+    ids: numpy.ndarray
+        (N,) int32 array of marker ids.
+    corners: numpy.ndarray
+        (N, 4, 2) float32 array of marker corners in pixels.
+    dictIndices: numpy.ndarray
+        (N,) int32 array of the index of each marker's dictionary (in the
+        list of configured dictionaries).
+    rvecs: numpy.ndarray or None
+        (N, 3) rotation vectors (None if no camera parameters were given).
+    tvecs: numpy.ndarray or None
+        (N, 3) translation vectors in meters (None if no camera parameters were given).
+    distances: numpy.ndarray or None
+        (N,) distances of the markers from the camera in meters.
+    timestamp: float
+        Time of the detection (seconds since the epoch).
+    """
+    __slots__ = ('ids', 'corners', 'dictIndices', 'rvecs', 'tvecs', 'distances',
+                 'timestamp')
+
+    def __init__(self, ids=None, corners=None, dictIndices=None, rvecs=None,
+                 tvecs=None, distances=None, timestamp: float = None):
+        self.ids = np.empty((0,), dtype=np.int32) if ids is None else ids
+        self.corners = np.empty((0, 4, 2), dtype=np.float32) \
+            if corners is None else corners
+        self.dictIndices = np.zeros(len(self.ids), dtype=np.int32) \
+            if dictIndices is None else dictIndices
+        self.rvecs = rvecs
+        self.tvecs = tvecs
+        self.distances = distances
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def toDict(self) -> dict:
+        """
+        Converts the result into a JSON-serializable dictionary.
+
+        Returns
+        -------
+        result: dict
+            The detection result with lists instead of arrays.
+        """
+        return {
+            'timestamp': self.timestamp,
+            'ids': self.ids.tolist(),
+            'corners': self.corners.tolist(),
+            'dictIndices': self.dictIndices.tolist(),
+            'rvecs': None if self.rvecs is None else self.rvecs.tolist(),
+            'tvecs': None if self.tvecs is None else self.tvecs.tolist(),
+            'distances': None if self.distances is None else self.distances.tolist()
+        }
+
+
+class arucoMarkerDetector:
+    """
+    Stateful ArUco detector holding a prebuilt `cv.aruco.ArucoDetector`.
+
+    The dictionaries and detector parameters are built once and only rebuilt
+    when `configure` is called with values different from the current ones.
+    Several dictionaries are decoded in a single pass: natively if OpenCV
+    provides `detectMarkersMultiDict` (>= 4.12), otherwise by decoding the
+    candidates rejected for the first dictionary against the other ones.
+    """
+
+    def __init__(self, cfgMarker: dict):
+        """
+        Parameters
+        ----------
+        cfgMarker: dict
+            The `marker` section of the configuration.
+        """
+        # Variables
+        self.dictNames = None
+        self.paramValues = None
+        self.detector = None
+        self.markerSize = cfgMarker['structure']['size']
+
+        # Detection settings
+        cfgDetection = cfgMarker['detection']
+        self.roi = {**DEFAULT_ROI_PARAMS, **cfgDetection.get('roi', {})}
+        self.emptyMask = {**DEFAULT_EMPTY_MASK_PARAMS,
+                          **cfgDetection.get('emptyMask', {})}
+        self.pyramid = {**DEFAULT_PYRAMID_PARAMS,
+                        **cfgDetection.get('pyramid', {})}
+
+        # Frame counters
+        self.framesTotal = 0
+        self.framesSkipped = 0
+
+        # Build the detector
+        self.configure(cfgDetection['dictionary'],
+                       cfgDetection.get('parameters', {}))
+
+    def configure(self, dictName, paramValues: dict = None) -> bool:
+        """
+        Rebuilds the underlying detector if the dictionaries or parameters changed.
+
+        Parameters
+        ----------
+        dictName: str or list
+            Name(s) of the Aruco dictionary(ies) to use.
+        paramValues: dict, optional
+            Values of `cv.aruco.DetectorParameters` attributes to override.
+
+        Returns
+        -------
+        rebuilt: bool
+            Whether the detector has been rebuilt.
+        """
+        # Check if anything has changed
+        dictNames = [dictName] if isinstance(dictName, str) else list(dictName)
+        paramValues = dict(paramValues or {})
+        if self.detector is not None and dictNames == self.dictNames \
+                and paramValues == self.paramValues:
+            return False
+
+        # Build the detector
+        self.dictionaries = [getArucoDict(name) for name in dictNames]
+        self.parameters = getDetectorParams(paramValues)
+        self.detector = cv.aruco.ArucoDetector(
+            self.dictionaries[0], self.parameters)
+        self.nativeMultiDict = len(dictNames) > 1 and \
+            hasattr(self.detector, 'detectMarkersMultiDict')
+        if self.nativeMultiDict:
+            self.detector.setDictionaries(self.dictionaries)
+        self.dictNames = dictNames
+        self.paramValues = paramValues
+        self.dictHits = [0] * len(dictNames)
+        return True
+
+    def detect(self, frame, cameraMatrix=None, distCoeffs=None) -> detectionResult:
+        """
+        Detects the markers in the frame (and their poses) without drawing anything.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            Frame to detect the markers in.
+        cameraMatrix: numpy.ndarray, optional
+            Camera matrix of the camera (poses are skipped if not provided).
+        distCoeffs: numpy.ndarray, optional
+            Distortion coefficients of the camera.
+
+        Returns
+        -------
+        result: detectionResult
+            The detected markers.
+        """
+        # Variables
+        timestamp = time.time()
+        self.framesTotal += 1
+
+        # Skip everything if the mask reveals nothing
+        if self.isEmpty(frame):
+            self.framesSkipped += 1
+            return detectionResult(timestamp=timestamp)
+
+        # Detect the markers
+        if self.roi['enable']:
+            corners, ids, dictIndices = self.detectInRegions(frame)
+        else:
+            corners, ids, dictIndices = self.detectFullFrame(frame)
+
+        # No markers detected
+        if len(ids) == 0:
+            return detectionResult(timestamp=timestamp)
+
+        # Stack the results
+        result = detectionResult(ids, corners, dictIndices, timestamp=timestamp)
+        for index in dictIndices:
+            self.dictHits[index] += 1
+
+        # If camera matrix and distortion coefficients are not provided, skip the poses
         if cameraMatrix is None or distCoeffs is None:
-            return frame
+            return result
 
         # Estimate the pose of the markers
-        rotationVecs, translationVecs, _ = cv.aruco.estimatePoseSingleMarkers(
-            corners, markerSize, cameraMatrix, distCoeffs)
+        result.rvecs, result.tvecs, result.distances = estimatePoses(
+            result.corners, self.markerSize, cameraMatrix, distCoeffs)
+
+        # Return
+        return result
+
+    def isEmpty(self, frame) -> bool:
+        """
+        Checks whether the empty-mask pre-check (if enabled) skips a frame.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            The binary mask.
+
+        Returns
+        -------
+        isEmpty: bool
+            Whether the mask cannot reveal any detectable marker.
+        """
+        if not self.emptyMask['enable']:
+            return False
+        minRatio = self.emptyMask['minRatio']
+        if minRatio is None:
+            minRatio = minMaskRatio(frame.shape, self.parameters.minMarkerPerimeterRate,
+                                    self.emptyMask['markerShare'])
+        return isMaskEmpty(frame, minRatio, self.emptyMask['downscale'])
+
+    def summary(self) -> str:
+        """
+        Returns a one-line summary of the frame counters.
+
+        Returns
+        -------
+        summary: str
+            The number of processed and skipped (empty-mask) frames, and the
+            number of markers found per dictionary.
+        """
+        skippedRate = self.framesSkipped / max(1, self.framesTotal) * 100
+        hits = ", ".join(f"{name}: {count}"
+                         for name, count in zip(self.dictNames, self.dictHits))
+        return f"[Info] Marker detector: {self.framesTotal} frames, " \
+            f"{self.framesSkipped} skipped as empty ({skippedRate:.1f}%), " \
+            f"markers found per dictionary [{hits}]"
+
+    def detectMarkers(self, image):
+        """
+        Runs the underlying detector on an image, decoding the candidates
+        against all the configured dictionaries.
+
+        Parameters
+        ----------
+        image: numpy.ndarray
+            Image to detect the markers in.
+
+        Returns
+        -------
+        corners: numpy.ndarray
+            (N, 4, 2) float32 array of marker corners in pixels.
+        ids: numpy.ndarray
+            (N,) int32 array of marker ids.
+        dictIndices: numpy.ndarray
+            (N,) int32 array of the dictionary index of each marker.
+        """
+        # Single dictionary
+        if len(self.dictionaries) == 1:
+            corners, ids, _ = self.detector.detectMarkers(image)
+            if ids is None:
+                return _noMarkers()
+            return np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2), \
+                ids.reshape(-1).astype(np.int32), np.zeros(len(ids), dtype=np.int32)
+
+        # Several dictionaries, decoded natively
+        if self.nativeMultiDict:
+            corners, ids, _, dictIndices = self.detector.detectMarkersMultiDict(image)
+            if ids is None or len(ids) == 0:
+                return _noMarkers()
+            return np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2), \
+                ids.reshape(-1).astype(np.int32), \
+                np.asarray(dictIndices).reshape(-1).astype(np.int32)
+
+        # Several dictionaries, sharing the candidates of the first one
+        corners, ids, rejected = self.detector.detectMarkers(image)
+        cornersList = [] if ids is None else \
+            list(np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2))
+        idsList = [] if ids is None else ids.reshape(-1).tolist()
+        dictIndices = [0] * len(idsList)
+        candidates = [np.asarray(candidate, dtype=np.float32).reshape(4, 2)
+                      for candidate in rejected]
+        if candidates:
+            gray = image if image.ndim == 2 else cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+            for dictIndex in range(1, len(self.dictionaries)):
+                remaining = []
+                for candidate in candidates:
+                    decoded = decodeCandidate(gray, candidate,
+                                              self.dictionaries[dictIndex],
+                                              self.parameters)
+                    if decoded is None:
+                        remaining.append(candidate)
+                        continue
+                    cornersList.append(decoded[0])
+                    idsList.append(decoded[1])
+                    dictIndices.append(dictIndex)
+                candidates = remaining
+
+        # Return
+        if not idsList:
+            return _noMarkers()
+        return np.array(cornersList, dtype=np.float32), \
+            np.array(idsList, dtype=np.int32), np.array(dictIndices, dtype=np.int32)
+
+    def detectFullFrame(self, frame):
+        """
+        Runs the marker detection on the whole frame, either directly or
+        coarse-to-fine (see `detectCoarseToFine`) if the pyramid is enabled.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            Frame to detect the markers in.
+
+        Returns
+        -------
+        corners: numpy.ndarray
+            (N, 4, 2) float32 array of marker corners in pixels.
+        ids: numpy.ndarray
+            (N,) int32 array of marker ids.
+        dictIndices: numpy.ndarray
+            (N,) int32 array of the dictionary index of each marker.
+        """
+        if self.pyramid['enable']:
+            return self.detectCoarseToFine(frame)
+        return self.detectMarkers(frame)
+
+    def detectCoarseToFine(self, frame):
+        """
+        Detects the markers on a downscaled copy of the frame, then refines their
+        corners to sub-pixel accuracy on the full-resolution frame, only inside
+        small windows around the found quads.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            Frame to detect the markers in.
+
+        Returns
+        -------
+        corners: numpy.ndarray
+            (N, 4, 2) float32 array of marker corners in pixels.
+        ids: numpy.ndarray
+            (N,) int32 array of marker ids.
+        dictIndices: numpy.ndarray
+            (N,) int32 array of the dictionary index of each marker.
+        """
+        # Variables
+        scale = self.pyramid['scale']
+        window = self.pyramid['refineWindow']
+        gray = frame if frame.ndim == 2 else cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+
+        # Detect on the coarse copy
+        coarse = cv.resize(gray, None, fx=scale, fy=scale,
+                           interpolation=cv.INTER_AREA)
+        corners, ids, dictIndices = self.detectMarkers(coarse)
+        if len(ids) == 0:
+            return corners, ids, dictIndices
+
+        # Map the corners back to full resolution (pixel centers) and refine them
+        corners = (corners.reshape(-1, 2) + 0.5) / scale - 0.5
+        corners = cv.cornerSubPix(gray, corners.reshape(-1, 1, 2), (window, window),
+                                  (-1, -1), _SUBPIX_CRITERIA)
+
+        # Return
+        return corners.reshape(-1, 4, 2), ids, dictIndices
+
+    def detectInRegions(self, frame):
+        """
+        Runs the marker detection only inside the padded regions revealed by the
+        (binary) mask, mapping the corners back to full-frame coordinates.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            Binary mask (single-channel, or three identical channels).
+
+        Returns
+        -------
+        corners: numpy.ndarray
+            (N, 4, 2) float32 array of marker corners in pixels.
+        ids: numpy.ndarray
+            (N,) int32 array of marker ids.
+        dictIndices: numpy.ndarray
+            (N,) int32 array of the dictionary index of each marker.
+        """
+        # Variables
+        height, width = frame.shape[:2]
+        mask = frame if frame.ndim == 2 else frame[:, :, 0]
+        cornersList, idsList, dictIndicesList = [], [], []
+
+        # Find the regions revealed by the mask
+        boxes = findMaskRegions(mask, self.roi['minSize'], self.roi['padding'],
+                                self.roi['downscale'])
+        if not boxes:
+            return _noMarkers()
+
+        # Large regions are not worth cropping
+        coverage = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in boxes)
+        if coverage > self.roi['maxCoverage'] * height * width:
+            return self.detectFullFrame(frame)
+
+        # Detect the markers in each crop and shift them back
+        for x0, y0, x1, y1 in boxes:
+            corners, ids, dictIndices = self.detectFullFrame(frame[y0:y1, x0:x1])
+            if len(ids):
+                corners += np.array([x0, y0], dtype=np.float32)
+                cornersList.append(corners)
+                idsList.append(ids)
+                dictIndicesList.append(dictIndices)
+
+        # No markers detected
+        if not idsList:
+            return _noMarkers()
+
+        # Return
+        return np.concatenate(cornersList), np.concatenate(idsList), \
+            np.concatenate(dictIndicesList)
+
+    def annotate(self, frame, result: detectionResult, cameraMatrix=None,
+                 distCoeffs=None):
+        """
+        Draws the detected markers (and their poses, if available) on the frame.
+        Single-channel frames (e.g., masks) are converted to BGR first, so the
+        conversion is only paid when an annotated image is actually needed.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            Frame to draw on (modified in place if already BGR).
+        result: detectionResult
+            The markers detected by `detect`.
+        cameraMatrix: numpy.ndarray, optional
+            Camera matrix of the camera.
+        distCoeffs: numpy.ndarray, optional
+            Distortion coefficients of the camera.
+
+        Returns
+        -------
+        frame: numpy.ndarray
+            BGR frame with detected markers.
+        """
+        # Variables
+        markerSize = self.markerSize
+
+        # Convert to BGR for drawing
+        if frame.ndim == 2:
+            frame = cv.cvtColor(frame, cv.COLOR_GRAY2BGR)
+
+        # Nothing to draw
+        if len(result) == 0:
+            return frame
+
+        # Draw the detected markers
+        cv.aruco.drawDetectedMarkers(frame, list(result.corners[:, None]),
+                                     result.ids.reshape(-1, 1))
+
+        # If the poses are not available, just draw the markers
+        if result.tvecs is None or cameraMatrix is None or distCoeffs is None:
+            return frame
 
         # Draw the axes and overlay text for each marker
-        for id in range(len(ids)):
+        for index in range(len(result)):
             # Draw the axes
             cv.drawFrameAxes(frame, cameraMatrix, distCoeffs,
-                             rotationVecs[id], translationVecs[id], length=0.1)
-            # Calculate the distance (magnitude of the translation vector)
-            distance = np.linalg.norm(translationVecs[id])
+                             result.rvecs[index], result.tvecs[index], length=0.1)
             # Prepare the text to display
-            text = f"[Marker-id {ids[id][0]}, size: {int(markerSize)*100}x{int(markerSize)*100}cm, distance: {distance*100:.1f}cm]"
+            text = f"[Marker-id {result.ids[index]}, size: {markerSize*100:.1f}x{markerSize*100:.1f}cm, distance: {result.distances[index]*100:.1f}cm]"
             # Set text position (near the top-left of the marker)
             textPosition = (5, frame.shape[0] - 10)
             # Add the text on the frame
             cv.putText(frame, text, textPosition, cv.FONT_HERSHEY_SIMPLEX,
                        0.3, (255, 150, 0), 1, cv.LINE_AA)
 
-    # Return
-    return frame
+        # Return
+        return frame
@@ -0,0 +1,197 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import time
+import cv2 as cv
+import numpy as np
+from .arucoDetector import arucoMarkerDetector, detectionResult, estimatePoses
+
+# Default tracking settings (overridable via `marker.tracking`)
+DEFAULT_TRACKING_PARAMS = {
+    # Track the markers between full detections
+    "enable": False,
+    # Maximum number of frames between two full detections
+    "redetectInterval": 10,
+    # Maximum forward-backward error (in pixels) of a tracked corner
+    "maxError": 1.5,
+    # Margin (in pixels) of the search window around each tracked marker
+    "searchMargin": 32,
+    # Window size and pyramid levels of the optical flow
+    "winSize": 15,
+    "maxLevel": 2
+}
+
+
+class markerTracker:
+    """
+    Wraps an `arucoMarkerDetector` and follows the detected marker corners with
+    sparse optical flow between periodic full detections.
+
+    A full detection is run every `redetectInterval` frames, and whenever the
+    previous frame had no markers or a corner fails the forward-backward check.
+    It exposes the same `detect`/`annotate`/`summary` methods as the detector.
+    """
+
+    def __init__(self, detector: arucoMarkerDetector, cfgTracking: dict = None):
+        """
+        Parameters
+        ----------
+        detector: arucoMarkerDetector
+            The detector used for the full detections.
+        cfgTracking: dict, optional
+            The `marker.tracking` section of the configuration.
+        """
+        # Variables
+        self.detector = detector
+        self.params = {**DEFAULT_TRACKING_PARAMS, **(cfgTracking or {})}
+        winSize = self.params['winSize']
+        self.flowParams = dict(winSize=(winSize, winSize),
+                               maxLevel=self.params['maxLevel'],
+                               criteria=(cv.TERM_CRITERIA_EPS | cv.TERM_CRITERIA_COUNT, 20, 0.03))
+        self.prevGray = None
+        self.prevResult = None
+        self.framesSinceDetection = 0
+
+        # Frame counters
+        self.framesDetected = 0
+        self.framesTracked = 0
+
+    def detect(self, frame, cameraMatrix=None, distCoeffs=None) -> detectionResult:
+        """
+        Detects (or tracks) the markers in the frame without drawing anything.
+
+        Parameters
+        ----------
+        frame: numpy.ndarray
+            Frame (mask) to detect the markers in.
+        cameraMatrix: numpy.ndarray, optional
+            Camera matrix of the camera (poses are skipped if not provided).
+        distCoeffs: numpy.ndarray, optional
+            Distortion coefficients of the camera.
+
+        Returns
+        -------
+        result: detectionResult
+            The detected (or tracked) markers.
+        """
+        # Tracking disabled
+        if not self.params['enable']:
+            self.framesDetected += 1
+            return self.detector.detect(frame, cameraMatrix, distCoeffs)
+
+        # Variables
+        gray = frame if frame.ndim == 2 else cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+
+        # Try to track the markers of the previous frame
+        result = None
+        canTrack = self.prevResult is not None and len(self.prevResult) > 0 \
+            and self.prevGray is not None and self.prevGray.shape == gray.shape \
+            and self.framesSinceDetection < self.params['redetectInterval']
+        if canTrack and not self.detector.isEmpty(gray):
+            result = self.track(gray, cameraMatrix, distCoeffs)
+
+        # Fall back to a full detection
+        if result is None:
+            result = self.detector.detect(gray, cameraMatrix, distCoeffs)
+            self.framesSinceDetection = 0
+            self.framesDetected += 1
+        else:
+            self.framesSinceDetection += 1
+            self.framesTracked += 1
+
+        # Keep the state for the next frame
+        self.prevGray = gray
+        self.prevResult = result
+
+        # Return
+        return result
+
+    def track(self, gray, cameraMatrix, distCoeffs):
+        """
+        Follows the corners of the previous markers with a forward-backward
+        checked pyramidal Lucas-Kanade optical flow, computed only inside a
+        window around each marker (not on the whole frame).
+
+        Parameters
+        ----------
+        gray: numpy.ndarray
+            Current single-channel frame.
+        cameraMatrix: numpy.ndarray
+            Camera matrix of the camera (poses are skipped if not provided).
+        distCoeffs: numpy.ndarray
+            Distortion coefficients of the camera.
+
+        Returns
+        -------
+        result: detectionResult or None
+            The tracked markers, or None if tracking is not reliable.
+        """
+        # Variables
+        height, width = gray.shape[:2]
+        margin = self.params['searchMargin']
+        corners = np.empty_like(self.prevResult.corners)
+
+        for index, prevCorners in enumerate(self.prevResult.corners):
+            # Search window around the previous marker
+            x0, y0 = np.maximum(prevCorners.min(axis=0).astype(int) - margin, 0)
+            x1, y1 = prevCorners.max(axis=0).astype(int) + margin
+            x1, y1 = min(x1, width), min(y1, height)
+            if x1 - x0 < 2 or y1 - y0 < 2:
+                return None
+            prevCrop, crop = self.prevGray[y0:y1, x0:x1], gray[y0:y1, x0:x1]
+            points = (prevCorners - (x0, y0)).astype(np.float32).reshape(-1, 1, 2)
+
+            # Forward and backward flows
+            tracked, status, _ = cv.calcOpticalFlowPyrLK(
+                prevCrop, crop, points, None, **self.flowParams)
+            backTracked, backStatus, _ = cv.calcOpticalFlowPyrLK(
+                crop, prevCrop, tracked, None, **self.flowParams)
+
+            # Check the confidence of every corner
+            errors = np.linalg.norm((backTracked - points).reshape(-1, 2), axis=1)
+            if not (status.all() and backStatus.all()) \
+                    or errors.max() > self.params['maxError']:
+                return None
+
+            # The corners should stay inside the search window
+            tracked = tracked.reshape(4, 2)
+            if tracked.min() < 0 or (tracked[:, 0] >= x1 - x0).any() \
+                    or (tracked[:, 1] >= y1 - y0).any():
+                return None
+            corners[index] = tracked + (x0, y0)
+
+        # Prepare the result
+        result = detectionResult(self.prevResult.ids, corners,
+                                 self.prevResult.dictIndices, timestamp=time.time())
+        if cameraMatrix is not None and distCoeffs is not None:
+            result.rvecs, result.tvecs, result.distances = estimatePoses(
+                corners, self.detector.markerSize, cameraMatrix, distCoeffs)
+
+        # Return
+        return result
+
+    def annotate(self, frame, result: detectionResult, cameraMatrix=None,
+                 distCoeffs=None):
+        """
+        Draws the markers on the frame (see `arucoMarkerDetector.annotate`).
+        """
+        return self.detector.annotate(frame, result, cameraMatrix, distCoeffs)
+
+    def summary(self) -> str:
+        """
+        Returns a one-line summary of the frame counters.
+
+        Returns
+        -------
+        summary: str
+            The number of detected and tracked frames (and the detector's counters).
+        """
+        return f"{self.detector.summary()}\n[Info] Marker tracker: " \
+            f"{self.framesDetected} frames detected, {self.framesTracked} frames tracked"
@@ -0,0 +1,252 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import itertools
+import cv2 as cv
+from .sources import videoSource, createOfflineSource
+from .engine import framePipeline
+from .parameters import normalizeParameters
+from .stages import createStages, detectionRecord
+from concurrent.futures import ProcessPoolExecutor
+
+# Default batch settings of the pipeline
+DEFAULT_BATCH_PARAMS = {
+    'workers': 0,
+    'chunkFrames': 300
+}
+
+# Extensions of the images found in the offline folders
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+
+def initWorker():
+    # Each process is a worker of its own (no nested OpenCV threads)
+    cv.setNumThreads(1)
+
+
+def batchRecord(context, mode: str) -> dict:
+    # Detections of a frame, with the duration of each stage
+    return {**detectionRecord(context, mode),
+            'timings': {name: round(duration, 3)
+                        for name, duration in context.timings.items()}}
+
+
+def processVideoChunk(task: tuple) -> list:
+    """
+    Processes a range of frames of the offline video (in a worker process).
+
+    Parameters
+    ----------
+    task: tuple
+        The `configs` section of the configuration, and the first and last
+        (excluded, None for the end of the video) frames of the range.
+
+    Returns
+    -------
+    records: list
+        The detection records of the frames, in order.
+    """
+    # Variables
+    config, start, end = task
+    mode = config['mode']['runner']
+    records = []
+
+    # Open the video and seek to the range (one frame of overlap, used as the
+    # previous frame of the temporal subtraction)
+    source = videoSource(config)
+    if not source.open():
+        return records
+    stages = createStages(config, source, annotate=False)
+    if not source.seek(max(0, start - 1)):
+        source.release()
+        return records
+    if start > 0:
+        packet = source.read()
+        if packet is not None:
+            stages[0].processor.prime(packet)
+
+    # Process the frames of the range
+    pipeline = framePipeline(source, stages, outputs=set())
+    try:
+        for _ in range(start, end) if end is not None else itertools.count(start):
+            context = pipeline.step()
+            if context is None:
+                break
+            records.append(batchRecord(context, mode))
+    finally:
+        pipeline.close()
+
+    # Return
+    return records
+
+
+def processImage(task: tuple) -> list:
+    """
+    Processes an offline image pair ("sv_offImg") or UV/IR image ("sv_offImgUV")
+    (in a worker process).
+
+    Parameters
+    ----------
+    task: tuple
+        The `configs` section of the configuration (pointing at the image), the
+        index of the image in the folder and its (left) path.
+
+    Returns
+    -------
+    records: list
+        The detection record of the image (empty if it could not be read).
+    """
+    # Variables
+    config, index, path = task
+    source = createOfflineSource(config)
+    if not source.open():
+        return []
+
+    # Process the image
+    pipeline = framePipeline(source, createStages(config, source, annotate=False),
+                             outputs=set())
+    try:
+        context = pipeline.step()
+    finally:
+        pipeline.close()
+    if context is None:
+        return []
+
+    # Return
+    return [{**batchRecord(context, config['mode']['runner']),
+             'frame': index, 'image': path}]
+
+
+def imageTasks(config: dict) -> list:
+    """
+    Walks the offline folder of the mode: the pairs of "sv_offImg" are the files
+    ending with the first name of `image.names`, next to the files ending with
+    the second one (e.g., "Scene1-Img-L.jpg" and "Scene1-Img-R.jpg"), and the
+    images of "sv_offImgUV" are all the images in the folder of `imageUV.path`
+    (or in `imageUV.path` itself if it is a folder).
+    """
+    # Variables
+    mode = config['mode']['runner']
+    cfgOffline = config['sensor']['offline']
+    if mode == 'sv_offImg':
+        folder = cfgOffline['image']['folder']
+        leftName, rightName = cfgOffline['image']['names'][:2]
+    else:
+        folder = cfgOffline['imageUV']['path']
+        if not os.path.isdir(folder):
+            folder = os.path.dirname(folder)
+
+    # Find the images
+    tasks = []
+    for root, _, files in sorted(os.walk(folder)):
+        for file in sorted(files):
+            if mode == 'sv_offImg':
+                if not file.endswith(leftName):
+                    continue
+                pairName = file[:len(file) - len(leftName)] + rightName
+                if pairName not in files:
+                    continue
+                taskConfig = copy.deepcopy(config)
+                taskConfig['sensor']['offline']['image'].update(
+                    {'folder': root, 'names': [file, pairName]})
+            else:
+                if not file.lower().endswith(IMAGE_EXTENSIONS):
+                    continue
+                taskConfig = copy.deepcopy(config)
+                taskConfig['sensor']['offline']['imageUV']['path'] = \
+                    os.path.join(root, file)
+            tasks.append((taskConfig, len(tasks), os.path.join(root, file)))
+    return tasks
+
+
+def videoTasks(config: dict, chunkFrames: int) -> list:
+    # Split the frames of the video into ranges (the frame count of the container
+    # is an estimate, so the last range goes on until the end of the video)
+    source = videoSource(config)
+    if not source.open():
+        return []
+    frameCount = source.frameCount()
+    source.release()
+    starts = list(range(0, max(frameCount, 1), chunkFrames))
+    return [(config, start, end) for start, end in zip(starts, starts[1:] + [None])]
+
+
+def runner_batch(config: dict, outputPath: str = None):
+    """
+    Processes the offline data of the selected mode in a process pool, without
+    any GUI, and writes the detections (with their timings) as JSON lines in
+    order to stdout or to a file. The offline video ("sv_offVid") is split into
+    ranges of frames processed by different workers.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration.
+    outputPath: str, optional
+        Path of the file to write the detections to (stdout if not provided).
+    """
+    # Get the config values
+    mode = config['mode']['runner']
+    cfgBatch = {**DEFAULT_BATCH_PARAMS,
+                **config.get('pipeline', {}).get('batch', {})}
+    workers = cfgBatch['workers'] or os.cpu_count()
+
+    # Normalize the tunable values
+    normalizeParameters(config)
+
+    # Split the work
+    if mode == 'sv_offVid':
+        tasks, worker = videoTasks(config, cfgBatch['chunkFrames']), processVideoChunk
+    elif mode in ('sv_offImg', 'sv_offImgUV'):
+        tasks, worker = imageTasks(config), processImage
+    else:
+        print(f'[Error] The batch mode is not available for "{mode}". Exiting ...',
+              file=sys.stderr)
+        return
+    if not tasks:
+        cfgOffline = config['sensor']['offline']
+        if mode == 'sv_offVid':
+            reason = f'the video "{cfgOffline["video"]["path"]}" could not be opened'
+        elif mode == 'sv_offImg':
+            reason = (f'no image pairs named {cfgOffline["image"]["names"][:2]} '
+                      f'were found in "{cfgOffline["image"]["folder"]}"')
+        else:
+            reason = f'no images were found in "{cfgOffline["imageUV"]["path"]}"'
+        print(f'[Error] Nothing to process for "{mode}": {reason}. Exiting ...',
+              file=sys.stderr)
+        return
+
+    # Process the tasks in a process pool, writing the results in order
+    print(f'Framework started! [Batch "{mode}" - {len(tasks)} tasks on {workers} workers]',
+          file=sys.stderr)
+    startTime = time.perf_counter()
+    frames = 0
+    output = sys.stdout if outputPath is None else open(outputPath, 'w')
+    try:
+        with ProcessPoolExecutor(workers, initializer=initWorker) as executor:
+            chunkSize = max(1, len(tasks) // (workers * 4))
+            for records in executor.map(worker, tasks, chunksize=chunkSize):
+                for record in records:
+                    output.write(json.dumps(record) + '\n')
+                frames += len(records)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    # Summary
+    elapsed = time.perf_counter() - startTime
+    print(f'[Info] Batch: {frames} frames in {elapsed:.2f} s '
+          f'({frames / max(elapsed, 1e-9):.1f} fps)', file=sys.stderr)
+    print(f'Framework stopped! [Batch "{mode}"]', file=sys.stderr)
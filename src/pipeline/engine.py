@@ -0,0 +1,329 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import time
+import queue
+import threading
+import numpy as np
+from collections import deque
+from .sources import frameSource
+from .stages import frameContext
+
+# Default executor settings of the pipeline
+DEFAULT_EXECUTOR_PARAMS = {
+    'pipelined': False,
+    'queueSize': 2
+}
+
+
+class pipelineMetrics:
+    """
+    Per-stage timings, frame rate and capture-to-process latency of a pipeline
+    (and the skew between the two cameras of the stereo setups).
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Parameters
+        ----------
+        window: int
+            Number of most recent frames the latency percentiles are computed on.
+        """
+        self.frames = 0
+        self.stageTotals = {}
+        self.latencies = deque(maxlen=window)
+        self.skews = deque(maxlen=window)
+        self.startTime = None
+        self.lastTime = None
+
+    def record(self, context: frameContext):
+        """
+        Adds the timings of a processed frame.
+
+        Parameters
+        ----------
+        context: frameContext
+            The processed frame.
+        """
+        now = time.perf_counter()
+        if self.startTime is None:
+            self.startTime = now
+        self.lastTime = now
+        self.frames += 1
+        self.latencies.append((now - context.packet.captureTime) * 1000.0)
+        frameTimes = context.packet.frameTimes
+        if frameTimes is not None and len(frameTimes) == 2:
+            self.skews.append(abs(frameTimes[1] - frameTimes[0]) * 1000.0)
+        for name, duration in context.timings.items():
+            self.stageTotals[name] = self.stageTotals.get(name, 0.0) + duration
+
+    def summary(self) -> str:
+        """
+        Returns a summary of the frame rate, the mean stage durations, the
+        capture-to-process latency and the stereo skew.
+
+        Returns
+        -------
+        summary: str
+            The summary of the metrics.
+        """
+        elapsed = (self.lastTime - self.startTime) if self.frames > 1 else 0.0
+        fps = (self.frames - 1) / elapsed if elapsed > 0 else 0.0
+        stages = ", ".join(f"{name}: {total / max(1, self.frames):.2f} ms"
+                           for name, total in self.stageTotals.items())
+        summary = f"[Info] Pipeline: {self.frames} frames at {fps:.1f} fps " \
+            f"(mean per frame [{stages}])"
+        if self.latencies:
+            p50, p95, p99 = np.percentile(self.latencies, [50, 95, 99])
+            summary += f"\n[Info] Capture-to-process latency: p50 {p50:.2f} ms, " \
+                f"p95 {p95:.2f} ms, p99 {p99:.2f} ms"
+        if self.skews:
+            p50, p95, p99 = np.percentile(self.skews, [50, 95, 99])
+            summary += f"\n[Info] Stereo capture skew: p50 {p50:.2f} ms, " \
+                f"p95 {p95:.2f} ms, p99 {p99:.2f} ms, max {max(self.skews):.2f} ms"
+        return summary
+
+
+class framePipeline:
+    """
+    Reads the frames of a source and runs them through the stages in order.
+    """
+
+    def __init__(self, source: frameSource, stages: list, outputs: set = None,
+                 params=None):
+        """
+        Parameters
+        ----------
+        source: frameSource
+            The (opened) frame source.
+        stages: list
+            The `pipelineStage` objects to run on every frame, in order.
+        outputs: set, optional
+            The optional products consumed outside the stages (see `setOutputs`).
+        params: runtimeParameters, optional
+            The runtime parameters, whose version is kept with each frame.
+        """
+        self.source = source
+        self.stages = stages
+        self.params = params
+        self.metrics = pipelineMetrics()
+        self.setOutputs(outputs)
+
+    def setOutputs(self, outputs: set):
+        """
+        Sets the optional products consumed outside the stages (e.g., by the
+        active tab of the GUI or the recording). The products nobody consumes
+        are not computed for the next frames (the stages only read the mask and
+        the detections, which are always computed).
+
+        Parameters
+        ----------
+        outputs: set or None
+            The consumed products (None: all of them).
+        """
+        self.outputs = None if outputs is None else set(outputs)
+
+    def readContext(self) -> frameContext:
+        # Retrieve frames (None at the end of the stream)
+        start = time.perf_counter()
+        packet = self.source.read()
+        if packet is None:
+            return None
+        context = frameContext(packet, self.outputs,
+                               0 if self.params is None else self.params.version)
+        context.timings['read'] = (time.perf_counter() - start) * 1000.0
+        return context
+
+    def runStage(self, stage, context: frameContext):
+        # Run a stage on a frame and record its duration
+        start = time.perf_counter()
+        stage.process(context)
+        context.timings[stage.name] = (time.perf_counter() - start) * 1000.0
+
+    def step(self) -> frameContext:
+        """
+        Reads the next frames and runs all the stages on them.
+
+        Returns
+        -------
+        context: frameContext or None
+            The processed frame, or None at the end of the stream.
+        """
+        # Retrieve frames
+        context = self.readContext()
+        if context is None:
+            return None
+
+        # Run the stages
+        for stage in self.stages:
+            self.runStage(stage, context)
+
+        # Return
+        self.metrics.record(context)
+        return context
+
+    def close(self):
+        """
+        Closes the stages and releases the source.
+        """
+        for stage in self.stages:
+            stage.close()
+        self.source.release()
+
+    def summary(self) -> str:
+        """
+        Returns the summaries of the stages and the pipeline metrics.
+
+        Returns
+        -------
+        summary: str
+            One line per source or stage with counters, then the pipeline metrics.
+        """
+        lines = [self.source.summary()] + [stage.summary() for stage in self.stages]
+        return "\n".join([line for line in lines if line] + [self.metrics.summary()])
+
+
+class pipelinedPipeline(framePipeline):
+    """
+    Runs the capture and every stage on its own worker thread, connected by
+    bounded queues, so that consecutive frames are in different stages at the
+    same time (OpenCV releases the GIL). The throughput tends to the rate of the
+    slowest stage instead of the sum of all the stages. Each stage has a single
+    worker, so the frames (and their contexts) come out in capture order.
+    """
+
+    def __init__(self, source: frameSource, stages: list, queueSize: int = 2,
+                 outputs: set = None, params=None):
+        """
+        Parameters
+        ----------
+        source: frameSource
+            The (opened) frame source.
+        stages: list
+            The `pipelineStage` objects to run on every frame, in order.
+        queueSize: int
+            Maximum number of frames waiting in-between two stages.
+        outputs: set, optional
+            The optional products consumed outside the stages (see `setOutputs`).
+        params: runtimeParameters, optional
+            The runtime parameters, whose version is kept with each frame.
+        """
+        super().__init__(source, stages, outputs, params)
+        self.queues = [queue.Queue(maxsize=max(1, queueSize))
+                       for _ in range(len(stages) + 1)]
+        self.running = True
+        self.error = None
+        self.threads = [threading.Thread(target=self.readWorker, daemon=True)]
+        self.threads += [threading.Thread(target=self.stageWorker,
+                                          args=(stage, index), daemon=True)
+                         for index, stage in enumerate(stages)]
+        for thread in self.threads:
+            thread.start()
+
+    def put(self, index: int, context: frameContext) -> bool:
+        # Wait for room in the queue, unless the pipeline is being closed
+        while self.running:
+            try:
+                self.queues[index].put(context, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self, index: int) -> frameContext:
+        # Wait for a frame in the queue, unless the pipeline is being closed
+        while self.running:
+            try:
+                return self.queues[index].get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def readWorker(self):
+        # Feed the first queue with the frames of the source
+        try:
+            while self.running:
+                context = self.readContext()
+                if not self.put(0, context) or context is None:
+                    return
+        except Exception as e:
+            self.error = e
+            self.put(0, None)
+
+    def stageWorker(self, stage, index: int):
+        # Run a stage on the frames of its input queue
+        while self.running:
+            context = self.get(index)
+            if context is not None and self.error is None:
+                try:
+                    self.runStage(stage, context)
+                except Exception as e:
+                    self.error = e
+                    context = None
+            if not self.put(index + 1, context) or context is None:
+                return
+
+    def step(self) -> frameContext:
+        """
+        Returns the next processed frame (in capture order).
+
+        Returns
+        -------
+        context: frameContext or None
+            The processed frame, or None at the end of the stream.
+        """
+        context = self.get(len(self.stages))
+        if self.error is not None:
+            raise self.error
+        if context is not None:
+            self.metrics.record(context)
+        return context
+
+    def close(self):
+        """
+        Stops the workers, closes the stages and releases the source.
+        """
+        self.running = False
+        for thread in self.threads:
+            thread.join(timeout=2.0)
+        super().close()
+
+
+def createPipeline(config: dict, source: frameSource, stages: list,
+                   outputs: set = None, params=None) -> framePipeline:
+    """
+    Creates the pipeline running the stages, serial or pipelined across threads
+    (if `pipeline.executor.pipelined` is enabled). Static sources always run
+    serially: their frames are processed on demand, not re-read in the background.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration.
+    source: frameSource
+        The (opened) frame source.
+    stages: list
+        The `pipelineStage` objects to run on every frame, in order.
+    outputs: set, optional
+        The optional products consumed outside the stages (None: all of them).
+    params: runtimeParameters, optional
+        The runtime parameters, whose version is kept with each frame.
+
+    Returns
+    -------
+    pipeline: framePipeline
+        The pipeline.
+    """
+    cfgExecutor = {**DEFAULT_EXECUTOR_PARAMS,
+                   **config.get('pipeline', {}).get('executor', {})}
+    if cfgExecutor['pipelined'] and not source.static:
+        return pipelinedPipeline(source, stages, cfgExecutor['queueSize'],
+                                 outputs, params)
+    return framePipeline(source, stages, outputs, params)
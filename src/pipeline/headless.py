@@ -0,0 +1,60 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import sys
+from .engine import createPipeline
+from .sources import createSource
+from .parameters import normalizeParameters
+from .stages import createStages, jsonSinkStage
+
+
+def runner_headless(config: dict, outputPath: str = None):
+    """
+    Runs the capture, processing and detection pipeline of the selected mode
+    without any GUI, with the parameters of the configuration file, streaming the
+    detections as JSON lines (one per frame) to stdout or to a file.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration.
+    outputPath: str, optional
+        Path of the file to write the detections to (stdout if not provided).
+    """
+    # Normalize the tunable values
+    normalizeParameters(config)
+
+    # Open the frame source (status messages go to stderr to keep stdout parsable)
+    source = createSource(config)
+    print(f'Framework started! [{source.name} - Headless]', file=sys.stderr)
+    if not source.open():
+        source.release()
+        return
+
+    # Build the pipeline (nothing is drawn nor shown)
+    output = sys.stdout if outputPath is None else open(outputPath, 'w')
+    stages = createStages(config, source, annotate=False)
+    stages.append(jsonSinkStage(output, config['mode']['runner']))
+    pipeline = createPipeline(config, source, stages, outputs=set())
+
+    try:
+        while pipeline.step() is not None:
+            # Static sources always return the same frames
+            if source.static:
+                break
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        # Stop the pipeline
+        pipeline.close()
+        print(pipeline.summary(), file=sys.stderr)
+        print(f'Framework stopped! [{source.name} - Headless]', file=sys.stderr)
@@ -0,0 +1,161 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import dearpygui.dearpygui as dpg
+from ..gui.utils import rgbToHsvTuple
+
+# Color channels of the "ColorChannel" radio button
+CHANNEL_NAMES = {'Red': 'r', 'Green': 'g', 'Blue': 'b'}
+
+
+def oddKernel(size) -> int:
+    # The Gaussian kernel size should be odd
+    size = int(size)
+    return size if size % 2 == 1 else size + 1
+
+
+# Tunable parameters: name -> (path in the `configs` section, type)
+PARAMETER_PATHS = {
+    'alpha': (('sensor', 'general', 'brightness', 'alpha'), float),
+    'beta': (('sensor', 'general', 'brightness', 'beta'), int),
+    'maskSize': (('sensor', 'usbCam', 'maskSize'), float),
+    'enableMask': (('sensor', 'usbCam', 'enableMask'), bool),
+    'subtractRL': (('algorithm', 'process', 'subtractRL'), bool),
+    'greenLower': (('algorithm', 'process', 'colorRange', 'hsv_green', 'lower'), tuple),
+    'greenUpper': (('algorithm', 'process', 'colorRange', 'hsv_green', 'upper'), tuple),
+    'matchRate': (('algorithm', 'process', 'alignment', 'matchRate'), float),
+    'maxFeatures': (('algorithm', 'process', 'alignment', 'maxFeatures'), int),
+    'channel': (('algorithm', 'process', 'channel'), str),
+    'erosionKernel': (('algorithm', 'postprocess', 'erosionKernel'), int),
+    'gaussianKernel': (('algorithm', 'postprocess', 'gaussianKernel'), oddKernel),
+    'thresholdSize': (('algorithm', 'postprocess', 'threshold', 'size'), int),
+    'thresholdMethod': (('algorithm', 'postprocess', 'threshold', 'method'), str),
+    'invertBinary': (('algorithm', 'postprocess', 'invertBinary'), bool),
+}
+
+# GUI widgets: tag -> (parameter, conversion of the widget value)
+PARAMETER_WIDGETS = {
+    'camAlpha': ('alpha', float),
+    'camBeta': ('beta', int),
+    'CircMask': ('maskSize', float),
+    'CircMaskEnable': ('enableMask', bool),
+    'SubtractionOrder': ('subtractRL', bool),
+    'GreenRangeLow': ('greenLower', rgbToHsvTuple),
+    'GreenRangeHigh': ('greenUpper', rgbToHsvTuple),
+    'MatchRate': ('matchRate', float),
+    'MaxFeat': ('maxFeatures', int),
+    'ColorChannel': ('channel', lambda value: CHANNEL_NAMES.get(value, 'All')),
+    'Erosion': ('erosionKernel', int),
+    'Gaussian': ('gaussianKernel', oddKernel),
+    'Threshold': ('thresholdSize', int),
+    'ThreshMethod': ('thresholdMethod', str.lower),
+    'invertBinaryImage': ('invertBinary', bool),
+}
+
+
+class runtimeParameters:
+    """
+    The parameters that can be tuned at runtime (e.g., by the GUI). Each change
+    is written through to the configuration (read by the processing functions)
+    and increments `version`, so the users of the parameters can find out when
+    to rebuild what they derive from them (kernels, detectors, cached results)
+    by comparing a single integer.
+    """
+    alpha: float
+    beta: int
+    maskSize: float
+    enableMask: bool
+    subtractRL: bool
+    greenLower: tuple
+    greenUpper: tuple
+    matchRate: float
+    maxFeatures: int
+    channel: str
+    erosionKernel: int
+    gaussianKernel: int
+    thresholdSize: int
+    thresholdMethod: str
+    invertBinary: bool
+
+    def __init__(self, config: dict):
+        """
+        Parameters
+        ----------
+        config: dict
+            The `configs` section of the configuration (updated in-place).
+        """
+        self.config = config
+        self.version = 0
+
+        # Read the initial values (missing sections are left unset)
+        for name, (path, valueType) in PARAMETER_PATHS.items():
+            section = config
+            for key in path[:-1]:
+                section = section.get(key, {})
+            if path[-1] in section:
+                self.set(name, valueType(section[path[-1]]))
+        self.version = 0
+
+    def set(self, name: str, value):
+        """
+        Changes a parameter (a no-op if the value is the same).
+
+        Parameters
+        ----------
+        name: str
+            The name of the parameter (see `PARAMETER_PATHS`).
+        value: any
+            The new value.
+        """
+        if getattr(self, name, None) == value:
+            return
+        setattr(self, name, value)
+
+        # Write it through to the configuration
+        path, _ = PARAMETER_PATHS[name]
+        section = self.config
+        for key in path[:-1]:
+            section = section.setdefault(key, {})
+        section[path[-1]] = value
+        self.version += 1
+
+    def onWidgetChange(self, sender, appData, tag: str):
+        """
+        Callback of the GUI widgets, reading the new value of the widget.
+        """
+        name, convert = PARAMETER_WIDGETS[tag]
+        self.set(name, convert(dpg.get_value(tag)))
+
+    def bindWidgets(self):
+        """
+        Registers the callbacks of the GUI widgets shown for the current mode.
+        """
+        for tag in PARAMETER_WIDGETS:
+            if dpg.does_item_exist(tag):
+                dpg.set_item_callback(tag, self.onWidgetChange)
+                dpg.set_item_user_data(tag, tag)
+
+
+def normalizeParameters(config: dict) -> runtimeParameters:
+    """
+    Normalizes the tunable values of the configuration in-place as the GUI does
+    (e.g., an odd Gaussian kernel), for the runners without any widgets.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration (updated in-place).
+
+    Returns
+    -------
+    params: runtimeParameters
+        The parameters read from the configuration.
+    """
+    return runtimeParameters(config)
@@ -0,0 +1,169 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import cv2 as cv
+from concurrent.futures import ThreadPoolExecutor
+from .sources import DEFAULT_STEREO_PARAMS, framePacket, frameSource
+from ..iMarker_algorithms.process import sequentialFrameProcessing, singleFrameProcessing, stereoFrameProcessing
+
+
+def preprocessFrame(frame, ret: bool, flip: bool, alpha: float, beta: float):
+    """
+    Mirrors (if needed) and changes the brightness of a grabbed frame.
+
+    Parameters
+    ----------
+    frame: numpy.ndarray
+        The raw frame.
+    ret: bool
+        Whether the frame has been grabbed correctly (left untouched otherwise).
+    flip: bool
+        Whether to mirror the frame horizontally.
+    alpha: float
+        Brightness gain.
+    beta: float
+        Brightness offset.
+
+    Returns
+    -------
+    frame: numpy.ndarray
+        The preprocessed frame.
+    """
+    if not ret:
+        return frame
+    if flip:
+        frame = cv.flip(frame, 1)
+    return cv.convertScaleAbs(frame, alpha=alpha, beta=beta)
+
+
+class frameProcessor:
+    """
+    Turns the raw frames of a source into the iMarker mask, following the setup
+    of the source (single frame, temporal subtraction, image pair or stereo).
+    The processing values are read from the configuration on every frame, so
+    they can be changed in-between (e.g., by the GUI).
+    """
+
+    def __init__(self, config: dict, source: frameSource):
+        """
+        Parameters
+        ----------
+        config: dict
+            The `configs` section of the configuration.
+        source: frameSource
+            The source the frames come from.
+        """
+        self.config = config
+        self.source = source
+        self.mode = config['mode']['runner']
+        self.isSequential = config['mode']['temporalSubtraction'] \
+            and source.kind != 'stereo' and self.mode not in ['sv_offImgUV', 'sv_usbUv', 'sv_usbIr']
+        self.prevFrame = None
+
+        # Left and right frames of the stereo setups are preprocessed concurrently
+        cfgStereo = {**DEFAULT_STEREO_PARAMS,
+                     **config.get('pipeline', {}).get('stereo', {})}
+        self.pool = ThreadPoolExecutor(max_workers=2) \
+            if source.kind == 'stereo' and cfgStereo['parallel'] else None
+
+        # The iDS setup uses a preset homography for the alignment
+        if self.mode == 'dv_ids':
+            from ..iMarker_sensors.sensors.config.presets import homographyMatrixPreset_iDS
+            config['presetMat'] = homographyMatrixPreset_iDS
+
+    def prime(self, packet: framePacket):
+        """
+        Uses the frame of a packet as the previous frame of the next one, without
+        processing it (e.g., when starting in the middle of a video).
+
+        Parameters
+        ----------
+        packet: framePacket
+            The frame preceding the next processed one.
+        """
+        brightness = self.config['sensor']['general']['brightness']
+        self.prevFrame = cv.convertScaleAbs(
+            packet.frames[0], alpha=brightness['alpha'], beta=brightness['beta'])
+
+    def process(self, packet: framePacket, outputs: set = None) -> dict:
+        """
+        Processes the frames of a packet.
+
+        Parameters
+        ----------
+        packet: framePacket
+            The frames to process.
+        outputs: set, optional
+            The optional products consumed (only 'maskApplied' for now), the
+            others are not computed (None: all of them).
+
+        Returns
+        -------
+        products: dict
+            The frames to show ('left', 'right', 'main'), the mask ('mask', None if
+            it could not be computed) and the masked frame ('maskApplied').
+        """
+        # Variables
+        config = self.config
+        brightness = config['sensor']['general']['brightness']
+        alpha, beta = brightness['alpha'], brightness['beta']
+
+        # Stereo setups
+        if self.source.kind == 'stereo':
+            retL, retR = packet.rets
+            isUsb = self.mode == 'dv_usb'
+
+            # Flip the right frame and change brightness (synchronized before processing)
+            flips = [False, not isUsb or config['sensor']['usbCam']['flipImage']]
+            arguments = list(zip(packet.frames, packet.rets, flips))
+            if self.pool is None:
+                frameL, frameR = [preprocessFrame(*argument, alpha, beta)
+                                  for argument in arguments]
+            else:
+                frameL, frameR = self.pool.map(
+                    lambda argument: preprocessFrame(*argument, alpha, beta), arguments)
+
+            # Process frames
+            _, _, frameMask = stereoFrameProcessing(
+                frameL, frameR, retL, retR, config, isUsb)
+            return {'left': frameL if retL else None,
+                    'right': frameR if retR else None,
+                    'mask': frameMask if (retL and retR) else None}
+
+        # Image pair (previous and current frames)
+        if self.source.kind == 'pair':
+            prevFrame, currFrame = [cv.convertScaleAbs(frame, alpha=alpha, beta=beta)
+                                    for frame in packet.frames]
+        else:
+            currFrame = cv.convertScaleAbs(packet.frames[0], alpha=alpha, beta=beta)
+            # Only the first time, copy the current frame to the previous frame
+            prevFrame = currFrame if self.prevFrame is None else self.prevFrame
+            self.prevFrame = currFrame
+
+        # Process the frames
+        if self.isSequential:
+            _, cFrame, frameMask = sequentialFrameProcessing(
+                prevFrame, currFrame, True, config)
+        else:
+            cFrame, frameMask = singleFrameProcessing(currFrame, True, config)
+
+        # Return
+        products = {'left': prevFrame, 'right': currFrame, 'main': currFrame,
+                    'mask': frameMask}
+        if outputs is None or 'maskApplied' in outputs:
+            products['maskApplied'] = cv.bitwise_and(cFrame, cFrame, mask=frameMask)
+        return products
+
+    def close(self):
+        """
+        Stops the preprocessing thread pool (if any).
+        """
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
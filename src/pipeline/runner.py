@@ -0,0 +1,167 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import os
+import time
+import cv2 as cv
+import dearpygui.dearpygui as dpg
+from .stages import createStages
+from .engine import createPipeline
+from .sources import createSource
+from .parameters import runtimeParameters
+from ..gui.utils import frameSave
+from ..iMarker_algorithms.vision.concatImages import concatFramesHorizontal
+from ..gui.guiContent import activeTabImage, guiElements, loadImageAsTexture, onImageViewTabChange, updateWindowSize
+
+# Default display settings (maximum width of the previewed frames in pixels
+# and preview rate in Hz, 0 to refresh on every processed frame)
+DEFAULT_DISPLAY_PARAMS = {
+    'resolution': 400,
+    'rate': 15
+}
+
+
+def runner_gui(config: dict):
+    """
+    Runs the pipeline of the selected mode with the Dear PyGui interface.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration.
+    """
+    # Get the config values (the tunable ones are changed by the GUI callbacks)
+    cfgMode = config['mode']
+    cfgDisplay = {**DEFAULT_DISPLAY_PARAMS, **config.get('display', {})}
+    params = runtimeParameters(config)
+    source = createSource(config)
+    isSingleVision = source.kind != 'stereo'
+
+    # Window title
+    setupName = source.name
+    if cfgMode['runner'] in ['sv_rs', 'sv_offVid', 'sv_offImg']:
+        setupVariant = "Temporal Subtraction" if cfgMode['temporalSubtraction'] \
+            else "Masking"
+        setupName += f" - {setupVariant}"
+    print(f'Framework started! [{setupName}]')
+
+    # Open the frame source
+    if not source.open():
+        source.release()
+        return
+
+    # Build the pipeline (processing, detection and annotation), computing only
+    # the images of the active tab and of the recording
+    pipeline = createPipeline(config, source, createStages(config, source),
+                              outputs=set(), params=params)
+    processor = pipeline.stages[0].processor
+    recordedImages = ['left', 'right', 'marker'] \
+        if (not isSingleVision or processor.isSequential) else ['main', 'marker']
+
+    # Prepare a notFound image (shown for missing frames)
+    notFoundImage = cv.imread(
+        f"{os.getcwd()}/src/notFound.png", cv.IMREAD_COLOR)
+
+    # Initialize the GUI
+    dpg.create_context()
+    dpg.create_viewport(title='iMarker Detector Software')
+    dpg.setup_dearpygui()
+    dpg.set_viewport_resize_callback(updateWindowSize)
+
+    # Load logo image
+    loadImageAsTexture("./src/logo.png", "LogoImage")
+
+    # Use an invisible container for internal values
+    with dpg.value_registry():
+        dpg.add_bool_value(default_value=False, tag="RecordFlag")
+
+    # Define textures (created when their tab is first shown)
+    dpg.add_texture_registry(tag="FrameTextures", show=True)
+
+    # GUI content
+    guiElements(config, isSingleVision)
+    params.bindWidgets()
+
+    dpg.show_viewport()
+
+    # Results of the last processed frame(s), the version of the parameters
+    # they were processed with and the tab they were uploaded to (or whether
+    # the image of the tab is still to be computed)
+    images, imagesVersion, uploadedTab, uploadPending = None, None, None, False
+    tabImageMissing = False
+
+    # The GUI is refreshed at the preview rate, the frames are processed at the
+    # rate of the source in-between (static images on every GUI tick)
+    displayPeriod = 1.0 / cfgDisplay['rate'] if cfgDisplay['rate'] else 0.0
+    previewRate = f"{cfgDisplay['rate']:g} Hz" if cfgDisplay['rate'] else "every frame"
+    lastDisplayTime, displayedFrames = float('-inf'), 0
+    startTime = time.perf_counter()
+
+    try:
+        while dpg.is_dearpygui_running():
+            # Whether the GUI is refreshed after this frame (static images on
+            # every GUI tick, otherwise at the preview rate)
+            currentTime = time.perf_counter()
+            displayDue = source.static or tabImageMissing \
+                or currentTime - lastDisplayTime >= displayPeriod
+
+            # Images consumed by the active tab (only for the frames shown)
+            # and by the recording
+            outputs = {activeTabImage()} - {None} if displayDue else set()
+            if dpg.get_value("RecordFlag"):
+                outputs.update(recordedImages)
+            pipeline.setOutputs(outputs)
+
+            # Retrieve and process the frames (static images only when a
+            # parameter has changed or an image is missing, otherwise the
+            # cached results are shown)
+            if images is None or not source.static or params.version != imagesVersion \
+                    or not outputs.issubset(images):
+                context = pipeline.step()
+                if context is None:
+                    break
+                images = {key: notFoundImage if frame is None else frame
+                          for key, frame in context.products.items()}
+                imagesVersion, uploadPending = context.version, True
+
+            # Record the frame(s)
+            if dpg.get_value("RecordFlag") and set(recordedImages).issubset(images):
+                imageList = [images[key] for key in recordedImages]
+                concatedImage = concatFramesHorizontal(imageList, 1800)
+                frameSave(concatedImage, cfgMode['runner'])
+                dpg.set_value("RecordFlag", False)
+
+            # Wait for the next refresh of the GUI
+            if not displayDue:
+                continue
+            lastDisplayTime = currentTime
+
+            # Update the textures (the latest result, once per result and active
+            # tab; frames read before the tab image was requested lack it)
+            activeTab = dpg.get_value("ImageTabBar")
+            if uploadPending or activeTab != uploadedTab:
+                tabImageMissing = not onImageViewTabChange(images, cfgDisplay['resolution'])
+                if not tabImageMissing:
+                    uploadedTab, uploadPending = activeTab, False
+
+            # You can manually stop by using stop_dearpygui()
+            dpg.render_dearpygui_frame()
+            displayedFrames += 1
+
+    finally:
+        # Stop the pipeline and close the windows
+        pipeline.close()
+        dpg.destroy_context()
+        elapsed = time.perf_counter() - startTime
+        print(pipeline.summary())
+        print(f'[Info] Display: {displayedFrames} refreshes at '
+              f'{displayedFrames / max(elapsed, 1e-9):.1f} fps '
+              f'(preview rate: {previewRate})')
+        print(f'Framework stopped! [{setupName}]')
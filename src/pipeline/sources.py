@@ -0,0 +1,676 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import os
+import sys
+import time
+import threading
+import cv2 as cv
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Default capture settings of the pipeline
+DEFAULT_CAPTURE_PARAMS = {
+    'threaded': False,
+    'bufferSize': 1
+}
+
+# Default settings of the dual-vision (stereo) setups
+DEFAULT_STEREO_PARAMS = {
+    'parallel': True,
+    'syncGrab': False
+}
+
+# Default processing settings (maximum width of the processed frames in
+# pixels, 0 for the full resolution)
+DEFAULT_PROCESSING_PARAMS = {
+    'resolution': 1000
+}
+
+
+# Frames sought before the target when seeking a video lands elsewhere
+SEEK_MARGIN = 64
+
+
+def processingWidth(config: dict) -> int:
+    # Maximum width of the processed frames (0: full resolution)
+    return {**DEFAULT_PROCESSING_PARAMS, **config.get('processing', {})}['resolution']
+
+
+def scaleIntrinsics(cameraMatrix, scale: float):
+    # Camera matrix of the frames resized by `scale` (focal lengths and principal point)
+    if cameraMatrix is None or scale == 1.0:
+        return cameraMatrix
+    scaledMatrix = np.array(cameraMatrix, dtype=np.float64)
+    scaledMatrix[:2] *= scale
+    return scaledMatrix
+
+
+class framePacket:
+    """
+    Frames grabbed at once from a source, with their metadata.
+
+    Attributes
+    ----------
+    index: int
+        Index of the packet in the stream.
+    timestamp: float
+        Time of the capture (seconds since the epoch).
+    frames: list
+        Raw frames (one for mono sources, two for stereo and image pair sources).
+    rets: list
+        Whether each frame has been grabbed correctly.
+    cameraMatrix: numpy.ndarray or None
+        Camera matrix of the frames (None if unknown).
+    distCoeffs: numpy.ndarray or None
+        Distortion coefficients of the frames (None if unknown).
+    captureTime: float
+        Monotonic time of the capture (`time.perf_counter`), for latencies.
+    frameTimes: list or None
+        Monotonic time each frame has been grabbed at (for the stereo skew).
+    """
+    __slots__ = ('index', 'timestamp', 'frames', 'rets', 'cameraMatrix',
+                 'distCoeffs', 'captureTime', 'frameTimes')
+
+    def __init__(self, index: int, frames: list, rets: list = None,
+                 cameraMatrix=None, distCoeffs=None, timestamp: float = None,
+                 frameTimes: list = None):
+        self.index = index
+        self.frames = frames
+        self.rets = [True] * len(frames) if rets is None else rets
+        self.cameraMatrix = cameraMatrix
+        self.distCoeffs = distCoeffs
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.captureTime = time.perf_counter()
+        self.frameTimes = frameTimes
+
+
+def presetCameraParams():
+    # Offline frames have been captured by the RealSense camera
+    from ..iMarker_sensors.sensors.config.presets import cameraMatrix_RealSense, distCoeffs_RealSense
+    return cameraMatrix_RealSense, distCoeffs_RealSense
+
+
+class frameSource:
+    """
+    Base class of the frame sources feeding the pipeline.
+
+    Attributes
+    ----------
+    name: str
+        Human-readable name of the setup.
+    kind: str
+        How the frames are processed: "single" (one frame, optionally with the
+        previous one), "pair" (previous/current image pair) or "stereo".
+    live: bool
+        Whether the frames come from a camera (markers can be tracked).
+    static: bool
+        Whether the source always returns the same frames.
+    cameraMatrix: numpy.ndarray or None
+        Camera matrix of the frames, unless given per packet (None if unknown).
+    distCoeffs: numpy.ndarray or None
+        Distortion coefficients of the frames, unless given per packet.
+    maxWidth: int
+        Maximum width of the frames (downscaled to it, with the intrinsics
+        scaled to match), 0 for the full resolution.
+    """
+    name = "Frame Source"
+    kind = "single"
+    live = False
+    static = False
+
+    def __init__(self):
+        self.index = 0
+        self.width = 0
+        self.height = 0
+        self.cameraMatrix = None
+        self.distCoeffs = None
+        self.maxWidth = 0
+        self.scale = 1.0
+
+    def open(self) -> bool:
+        """
+        Opens the source and sets its frame size.
+
+        Returns
+        -------
+        opened: bool
+            Whether the source is ready to be read.
+        """
+        raise NotImplementedError
+
+    def read(self) -> framePacket:
+        """
+        Grabs the next frames.
+
+        Returns
+        -------
+        packet: framePacket or None
+            The grabbed frames, or None at the end of the stream (or on failure).
+        """
+        raise NotImplementedError
+
+    def release(self):
+        """
+        Releases the resources of the source.
+        """
+        pass
+
+    def summary(self) -> str:
+        """
+        Returns a summary of the source counters (None if there is nothing to report).
+        """
+        return None
+
+    def processingSize(self, width: int, height: int) -> tuple:
+        # Size of the frames at the processing resolution
+        if not self.maxWidth or width <= self.maxWidth:
+            return width, height
+        return self.maxWidth, round(height * self.maxWidth / width)
+
+    def toProcessingResolution(self, frame):
+        # Downscale a frame to the processing resolution (keeping the scale
+        # for the intrinsics of the packet)
+        height, width = frame.shape[:2]
+        size = self.processingSize(width, height)
+        self.scale = size[0] / width
+        if size[0] == width:
+            return frame
+        return cv.resize(frame, size, interpolation=cv.INTER_AREA)
+
+    def nextPacket(self, frames: list, rets: list = None, cameraMatrix=None,
+                   distCoeffs=None, frameTimes: list = None) -> framePacket:
+        # Wrap the frames into a packet with the next index
+        if cameraMatrix is None:
+            cameraMatrix, distCoeffs = self.cameraMatrix, self.distCoeffs
+        packet = framePacket(self.index, frames, rets,
+                             scaleIntrinsics(cameraMatrix, self.scale), distCoeffs,
+                             frameTimes=frameTimes)
+        self.index += 1
+        return packet
+
+
+class rsSource(frameSource):
+    """
+    Color stream of an Intel RealSense camera (with its intrinsics).
+    """
+    name = "Single-Vision RealSense Setup"
+    live = True
+
+    def __init__(self, config: dict):
+        super().__init__()
+        self.cfgRS = config['sensor']['realSense']
+        self.maxWidth = processingWidth(config)
+        self.camera = None
+        self.isPipelineStarted = False
+
+    def open(self) -> bool:
+        from ..iMarker_sensors.sensors import rs_interface
+        resolution = self.cfgRS['resolution']
+        self.camera = rs_interface.rsCamera((resolution['width'], resolution['height']),
+                                            self.cfgRS['fps'])
+        self.width, self.height = self.processingSize(
+            resolution['width'], resolution['height'])
+        self.camera.createPipeline()
+        self.isPipelineStarted = self.camera.startPipeline()
+        return self.isPipelineStarted
+
+    def read(self) -> framePacket:
+        frames = self.camera.grabFrames()
+        if frames is None:
+            return None
+        frame, cameraMatrix, distCoeffs = self.camera.getColorFrame(frames)
+        return self.nextPacket([self.toProcessingResolution(frame)],
+                               cameraMatrix=cameraMatrix, distCoeffs=distCoeffs)
+
+    def release(self):
+        if self.isPipelineStarted:
+            self.camera.stopPipeline()
+
+
+class stereoSource(frameSource):
+    """
+    Base class of the pairs of cameras, grabbing both cameras concurrently on a
+    small thread pool (if `pipeline.stereo.parallel` is enabled).
+    """
+    kind = "stereo"
+    live = True
+
+    def __init__(self, config: dict):
+        super().__init__()
+        self.cfgStereo = {**DEFAULT_STEREO_PARAMS,
+                          **config.get('pipeline', {}).get('stereo', {})}
+        self.pool = ThreadPoolExecutor(max_workers=2) \
+            if self.cfgStereo['parallel'] else None
+        self.cameras = []
+
+    def mapCameras(self, function) -> tuple:
+        # Call the function on both cameras (concurrently if enabled)
+        def timedCall(camera):
+            result = function(camera)
+            return result, time.perf_counter()
+        if self.pool is None:
+            calls = [timedCall(camera) for camera in self.cameras]
+        else:
+            calls = list(self.pool.map(timedCall, self.cameras))
+        results, times = zip(*calls)
+        return list(results), list(times)
+
+    def release(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+
+
+class idsStereoSource(stereoSource):
+    """
+    Synchronized pair of iDS cameras (the second one is mirrored).
+    """
+    name = "Dual-Vision iDS Cameras Setup"
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.cfgIDSCam = config['sensor']['ids']
+
+    def open(self) -> bool:
+        from ..iMarker_sensors.sensors import ids_interface
+        cfgROI = self.cfgIDSCam['roi']
+        self.width, self.height = cfgROI['cap1']['width'], cfgROI['cap1']['height']
+
+        # Fetch the cameras and get their calibration configuration
+        root = f"{os.getcwd()}/src/iMarker_sensors/sensors/config"
+        self.cameras = [ids_interface.idsCamera(0), ids_interface.idsCamera(1)]
+        for camera, capName in zip(self.cameras, ['cap1', 'cap2']):
+            camera.getCalibrationConfig(root, capName.replace('cap', 'cam'))
+            camera.setROI(cfgROI[capName]['x'], cfgROI[capName]['y'],
+                          self.width, self.height)
+
+        # Synchronize the cameras and capture the frames
+        self.cameras[0].syncAsMaster()
+        self.cameras[1].syncAsSlave()
+        for camera in self.cameras:
+            camera.startAquisition()
+        for camera in self.cameras:
+            camera.setExposureTime(self.cfgIDSCam['exposureTime'])
+        return True
+
+    def read(self) -> framePacket:
+        frames, frameTimes = self.mapCameras(lambda camera: camera.getFrame())
+        rets = [bool(np.any(frame)) for frame in frames]
+        if not all(rets):
+            print("\n[Error] Seems like cameras are not connected or not working properly. Exiting ...",
+                  file=sys.stderr)
+            return None
+        return self.nextPacket(frames, rets, frameTimes=frameTimes)
+
+    def release(self):
+        super().release()
+        for camera in self.cameras:
+            camera.closeLibrary()
+
+
+class usbStereoSource(stereoSource):
+    """
+    Pair of USB cameras (left and right). With `pipeline.stereo.syncGrab`, both
+    devices are triggered with `grab()` back-to-back before the (slower) decoding
+    with `retrieve()`, so that the two exposures are as close as possible.
+    """
+    name = "Dual-Vision USB Cameras Setup"
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.cfgUsbCam = config['sensor']['usbCam']
+        self.cfgGeneral = config['sensor']['general']
+
+    def open(self) -> bool:
+        from ..iMarker_sensors.sensors import usb_interface as usb
+        self.usb = usb
+        try:
+            self.cameras = [usb.createCameraObject(self.cfgUsbCam['ports']['lCam']),
+                            usb.createCameraObject(self.cfgUsbCam['ports']['rCam'])]
+        except Exception as e:
+            print(f'- [Error] Error while fetching camera output: {e}', file=sys.stderr)
+            return False
+        if self.cfgGeneral['fpsBoost']:
+            for camera in self.cameras:
+                camera.set(cv.CAP_PROP_FPS, 30.0)
+        self.width = int(self.cameras[0].get(cv.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cameras[0].get(cv.CAP_PROP_FRAME_HEIGHT))
+        return True
+
+    def read(self) -> framePacket:
+        # Note: if each of the cameras not working, its ret will be False
+        if self.cfgStereo['syncGrab']:
+            grabbed, frameTimes = self.grabBackToBack()
+            retrieved, _ = self.mapCameras(lambda camera: camera.retrieve())
+            (retL, frameL), (retR, frameR) = retrieved
+            retL, retR = retL and grabbed[0], retR and grabbed[1]
+        else:
+            ((retL, frameL), (retR, frameR)), frameTimes = self.mapCameras(
+                self.usb.grabImage)
+        if not retL and not retR:
+            print('- [Error] no camera is connected! Exiting...', file=sys.stderr)
+            return None
+        return self.nextPacket([frameL, frameR], [retL, retR],
+                               frameTimes=frameTimes)
+
+    def grabBackToBack(self) -> tuple:
+        # Trigger both cameras one right after the other (no decoding in-between)
+        grabbed, frameTimes = [], []
+        for camera in self.cameras:
+            grabbed.append(camera.grab())
+            frameTimes.append(time.perf_counter())
+        return grabbed, frameTimes
+
+    def release(self):
+        super().release()
+        for camera in self.cameras:
+            camera.release()
+
+
+class usbMonoSource(frameSource):
+    """
+    Single USB camera (UV or IR).
+    """
+    live = True
+
+    def __init__(self, config: dict, cfgCamKey: str, cameraType: str):
+        super().__init__()
+        self.cfgCam = config['sensor'][cfgCamKey]
+        self.cfgGeneral = config['sensor']['general']
+        self.cameraType = cameraType
+        self.maxWidth = processingWidth(config)
+        self.name = f"Single-Vision {cameraType} Camera Setup"
+        self.camera = None
+
+    def open(self) -> bool:
+        from ..iMarker_sensors.sensors import usb_interface as usb
+        self.usb = usb
+        try:
+            self.camera = usb.createCameraObject(self.cfgCam['port'])
+        except Exception as e:
+            print(f'- [Error] Error while fetching camera output: {e}', file=sys.stderr)
+            return False
+        if self.cfgGeneral['fpsBoost']:
+            self.camera.set(cv.CAP_PROP_FPS, 30.0)
+        self.width, self.height = self.processingSize(
+            int(self.camera.get(cv.CAP_PROP_FRAME_WIDTH)),
+            int(self.camera.get(cv.CAP_PROP_FRAME_HEIGHT)))
+        return True
+
+    def read(self) -> framePacket:
+        ret, frame = self.usb.grabImage(self.camera)
+        if not ret:
+            print(f'- [Error] no {self.cameraType} camera is connected! Exiting...', file=sys.stderr)
+            return None
+        return self.nextPacket([self.toProcessingResolution(frame)])
+
+    def release(self):
+        if self.camera is not None:
+            self.camera.release()
+
+
+class videoSource(frameSource):
+    """
+    Offline video captured by the single-vision setup.
+    """
+    name = "Offline Video Captured by Single-Vision Setup"
+
+    def __init__(self, config: dict):
+        super().__init__()
+        self.cfgVideo = config['sensor']['offline']['video']
+        self.maxWidth = processingWidth(config)
+        self.capture = None
+        self.cameraMatrix, self.distCoeffs = presetCameraParams()
+
+    def open(self) -> bool:
+        if not os.path.exists(self.cfgVideo['path']):
+            print("Video file does not exist!", file=sys.stderr)
+            return False
+        self.capture = cv.VideoCapture(self.cfgVideo['path'])
+        if not self.capture.isOpened():
+            print("Error: Could not open video file.", file=sys.stderr)
+            return False
+        self.width, self.height = self.processingSize(
+            int(self.capture.get(cv.CAP_PROP_FRAME_WIDTH)),
+            int(self.capture.get(cv.CAP_PROP_FRAME_HEIGHT)))
+        return True
+
+    def read(self) -> framePacket:
+        ret, frame = self.capture.read()
+        if not ret:
+            return None
+        frame = self.toProcessingResolution(frame)
+        if self.cfgVideo['rotate']:
+            frame = cv.rotate(frame, cv.ROTATE_180)
+        return self.nextPacket([frame])
+
+    def frameCount(self) -> int:
+        """
+        Returns the number of frames of the (opened) video, as estimated by the
+        container (the actual number may differ).
+        """
+        return int(self.capture.get(cv.CAP_PROP_FRAME_COUNT))
+
+    def seek(self, frameIndex: int) -> bool:
+        """
+        Moves to the given frame, which will be returned by the next `read`.
+        Seeking lands on a key frame in many (inter-coded) videos, so the reached
+        position is checked; otherwise an earlier position is sought (down to the
+        start) and the frames in-between are grabbed.
+
+        Parameters
+        ----------
+        frameIndex: int
+            Index of the frame (from zero).
+
+        Returns
+        -------
+        success: bool
+            Whether the frame has been reached (False past the end of the video).
+        """
+        for position in sorted({frameIndex, max(0, frameIndex - SEEK_MARGIN), 0},
+                               reverse=True):
+            self.capture.set(cv.CAP_PROP_POS_FRAMES, position)
+            if int(self.capture.get(cv.CAP_PROP_POS_FRAMES)) == position:
+                break
+        for _ in range(frameIndex - position):
+            if not self.capture.grab():
+                return False
+        self.index = frameIndex
+        return True
+
+    def release(self):
+        if self.capture is not None:
+            self.capture.release()
+
+
+class imagePairSource(frameSource):
+    """
+    Offline pair of images (previous and current) captured by the single-vision setup.
+    """
+    name = "Offline Images Captured by Single-Vision Setup"
+    kind = "pair"
+    static = True
+
+    def __init__(self, config: dict):
+        super().__init__()
+        cfgImage = config['sensor']['offline']['image']
+        self.paths = [os.path.join(cfgImage['folder'], name)
+                      for name in cfgImage['names'][:2]]
+        self.maxWidth = processingWidth(config)
+        self.frames = None
+        self.cameraMatrix, self.distCoeffs = presetCameraParams()
+
+    def open(self) -> bool:
+        if not all(os.path.exists(path) for path in self.paths):
+            print("At leaset one image does not exist! Exiting ...", file=sys.stderr)
+            return False
+        self.frames = [self.toProcessingResolution(cv.imread(path))
+                       for path in self.paths]
+        self.height, self.width = self.frames[0].shape[:2]
+        return True
+
+    def read(self) -> framePacket:
+        return self.nextPacket(self.frames)
+
+
+class imageUVSource(frameSource):
+    """
+    Offline image captured by the single-vision UV/IR setup.
+    """
+    name = "Offline Images Captured by Single-Vision UV/IR Setup"
+    static = True
+
+    def __init__(self, config: dict):
+        super().__init__()
+        self.path = config['sensor']['offline']['imageUV']['path']
+        self.maxWidth = processingWidth(config)
+        self.frame = None
+        self.cameraMatrix, self.distCoeffs = presetCameraParams()
+
+    def open(self) -> bool:
+        if not os.path.exists(self.path):
+            print("Image does not exist! Exiting ...", file=sys.stderr)
+            return False
+        self.frame = self.toProcessingResolution(cv.imread(self.path))
+        self.height, self.width = self.frame.shape[:2]
+        return True
+
+    def read(self) -> framePacket:
+        return self.nextPacket([self.frame])
+
+
+class threadedSource(frameSource):
+    """
+    Reads another (live) source continuously on a capture thread into a small
+    ring buffer. When the buffer is full the oldest packet is dropped, so the
+    processing loop gets the freshest frames instead of the ones piled up in the
+    driver buffers (with a buffer size of 1, always the latest one).
+    """
+
+    def __init__(self, source: frameSource, bufferSize: int = 1):
+        """
+        Parameters
+        ----------
+        source: frameSource
+            The source to read on the capture thread.
+        bufferSize: int
+            Maximum number of packets waiting to be processed.
+        """
+        super().__init__()
+        self.source = source
+        self.name, self.kind = source.name, source.kind
+        self.live, self.static = source.live, source.static
+        self.buffer = deque(maxlen=max(1, bufferSize))
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.ended = False
+        self.framesCaptured = 0
+        self.framesDropped = 0
+
+    def open(self) -> bool:
+        if not self.source.open():
+            return False
+        self.width, self.height = self.source.width, self.source.height
+        self.cameraMatrix = self.source.cameraMatrix
+        self.distCoeffs = self.source.distCoeffs
+
+        # Start the capture thread
+        self.running = True
+        self.thread = threading.Thread(target=self.capture, daemon=True)
+        self.thread.start()
+        return True
+
+    def capture(self):
+        # Read the source until it ends or the capture is stopped
+        try:
+            while self.running:
+                packet = self.source.read()
+                if packet is None:
+                    break
+                with self.condition:
+                    self.framesCaptured += 1
+                    if len(self.buffer) == self.buffer.maxlen:
+                        self.framesDropped += 1
+                    self.buffer.append(packet)
+                    self.condition.notify()
+        finally:
+            with self.condition:
+                self.ended = True
+                self.condition.notify()
+
+    def read(self) -> framePacket:
+        with self.condition:
+            while not self.buffer and not self.ended:
+                self.condition.wait()
+            return self.buffer.popleft() if self.buffer else None
+
+    def release(self):
+        # Stop the capture thread before releasing the source
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=2.0)
+        self.source.release()
+
+    def summary(self) -> str:
+        droppedRate = self.framesDropped / max(1, self.framesCaptured) * 100
+        return f"[Info] Capture thread: {self.framesCaptured} frames captured, " \
+            f"{self.framesDropped} dropped ({droppedRate:.1f}%)"
+
+
+def createSource(config: dict) -> frameSource:
+    """
+    Creates the frame source matching the runner mode of the configuration.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration.
+
+    Returns
+    -------
+    source: frameSource
+        The (not yet opened) frame source. Live sources are read on a capture
+        thread if `pipeline.capture.threaded` is enabled.
+    """
+    mode = config['mode']['runner']
+    cfgCapture = {**DEFAULT_CAPTURE_PARAMS,
+                  **config.get('pipeline', {}).get('capture', {})}
+    if mode == 'sv_rs':
+        source = rsSource(config)
+    elif mode == 'dv_ids':
+        source = idsStereoSource(config)
+    elif mode == 'dv_usb':
+        source = usbStereoSource(config)
+    elif mode == 'sv_usbUv':
+        source = usbMonoSource(config, 'usbCamUV', 'UV')
+    elif mode == 'sv_usbIr':
+        source = usbMonoSource(config, 'usbCamIR_SV', 'IR')
+    else:
+        return createOfflineSource(config)
+
+    # Read the live sources on a capture thread
+    if cfgCapture['threaded']:
+        return threadedSource(source, cfgCapture['bufferSize'])
+    return source
+
+
+def createOfflineSource(config: dict) -> frameSource:
+    # Offline sources are read on demand (no frame should be dropped)
+    mode = config['mode']['runner']
+    if mode == 'sv_offVid':
+        return videoSource(config)
+    elif mode == 'sv_offImg':
+        return imagePairSource(config)
+    elif mode == 'sv_offImgUV':
+        return imageUVSource(config)
+    raise ValueError(f'The selected mode "{mode}" is not valid.')
@@ -0,0 +1,219 @@
+"""
+📝 'iMarker Detector (Standalone)' Software
+    SPDX-FileCopyrightText: (2025) University of Luxembourg
+    © 2025 University of Luxembourg
+    Developed by: Ali TOURANI et al. at SnT / ARG.
+
+'iMarker Detector (Standalone)' is licensed under the "SNT NON-COMMERCIAL" License.
+You may not use this file except in compliance with the License.
+"""
+
+import sys
+import json
+from .sources import framePacket, frameSource
+from .processing import frameProcessor
+from ..marker_detector.markerTracker import markerTracker
+from ..marker_detector.arucoDetector import arucoMarkerDetector, detectionResult
+
+
+class frameContext:
+    """
+    Everything known about a frame while it goes through the pipeline stages.
+
+    Attributes
+    ----------
+    packet: framePacket
+        The raw frames and their metadata.
+    products: dict
+        Frames produced by the stages (e.g., 'mask', 'maskApplied', 'marker').
+    detections: detectionResult or None
+        The detected markers (None before the detection stage).
+    timings: dict
+        Duration of each stage in milliseconds.
+    outputs: set or None
+        The optional products consumed (e.g., by the GUI), the others are not
+        computed (None: all of them).
+    version: int
+        Version of the runtime parameters when the frame was read (the ones it
+        is processed with).
+    """
+    __slots__ = ('packet', 'products', 'detections', 'timings', 'outputs', 'version')
+
+    def __init__(self, packet: framePacket, outputs: set = None, version: int = 0):
+        self.packet = packet
+        self.products = {}
+        self.detections = None
+        self.timings = {}
+        self.outputs = outputs
+        self.version = version
+
+    def wants(self, product: str) -> bool:
+        # Whether an optional product is consumed
+        return self.outputs is None or product in self.outputs
+
+
+class pipelineStage:
+    """
+    Base class of the pipeline stages, each updating the frame context in turn.
+    """
+    name = "stage"
+
+    def process(self, context: frameContext):
+        """
+        Runs the stage on a frame.
+
+        Parameters
+        ----------
+        context: frameContext
+            The frame to work on (updated in-place).
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases the resources of the stage.
+        """
+        pass
+
+    def summary(self) -> str:
+        """
+        Returns a summary of the stage counters (None if there is nothing to report).
+        """
+        return None
+
+
+class processingStage(pipelineStage):
+    """
+    Computes the iMarker mask (and the frames to show) from the raw frames.
+    """
+    name = "process"
+
+    def __init__(self, config: dict, source: frameSource):
+        self.processor = frameProcessor(config, source)
+
+    def process(self, context: frameContext):
+        context.products.update(self.processor.process(
+            context.packet, context.outputs))
+
+    def close(self):
+        self.processor.close()
+
+
+class detectionStage(pipelineStage):
+    """
+    Detects the markers (and their poses) in the mask; markers are tracked
+    in-between full detections for live sources.
+    """
+    name = "detect"
+
+    def __init__(self, cfgMarker: dict, source: frameSource):
+        self.detector = arucoMarkerDetector(cfgMarker)
+        if source.live:
+            self.detector = markerTracker(self.detector,
+                                          cfgMarker.get('tracking', {}))
+
+    def process(self, context: frameContext):
+        mask = context.products.get('mask')
+        if mask is None:
+            context.detections = detectionResult()
+            return
+        context.detections = self.detector.detect(
+            mask, context.packet.cameraMatrix, context.packet.distCoeffs)
+
+    def summary(self) -> str:
+        return self.detector.summary()
+
+
+class annotationStage(pipelineStage):
+    """
+    Draws the detected markers on the mask (the 'marker' product).
+    """
+    name = "annotate"
+
+    def __init__(self, detection: detectionStage):
+        self.detector = detection.detector
+
+    def process(self, context: frameContext):
+        if not context.wants('marker'):
+            return
+        mask = context.products.get('mask')
+        if mask is None:
+            context.products['marker'] = None
+            return
+        context.products['marker'] = self.detector.annotate(
+            mask, context.detections, context.packet.cameraMatrix,
+            context.packet.distCoeffs)
+
+
+def detectionRecord(context: frameContext, mode: str) -> dict:
+    """
+    Converts the detections of a frame into a JSON-serializable record.
+
+    Parameters
+    ----------
+    context: frameContext
+        The processed frame.
+    mode: str
+        The runner mode, added to the record.
+
+    Returns
+    -------
+    record: dict
+        The mode, frame index and detections of the frame.
+    """
+    return {'mode': mode, 'frame': context.packet.index,
+            **context.detections.toDict()}
+
+
+class jsonSinkStage(pipelineStage):
+    """
+    Writes the detections of every frame as a JSON line.
+    """
+    name = "sink"
+
+    def __init__(self, output, mode: str):
+        """
+        Parameters
+        ----------
+        output: file object
+            Text stream to write to (closed with the stage unless it is stdout).
+        mode: str
+            The runner mode, added to every line.
+        """
+        self.output = output
+        self.mode = mode
+
+    def process(self, context: frameContext):
+        if context.products.get('mask') is None:
+            return
+        self.output.write(json.dumps(detectionRecord(context, self.mode)) + '\n')
+        self.output.flush()
+
+    def close(self):
+        if self.output is not sys.stdout:
+            self.output.close()
+
+
+def createStages(config: dict, source: frameSource, annotate: bool = True) -> list:
+    """
+    Creates the default stages: processing, detection and (optionally) annotation.
+
+    Parameters
+    ----------
+    config: dict
+        The `configs` section of the configuration.
+    source: frameSource
+        The source the frames come from.
+    annotate: bool
+        Whether to draw the markers (only needed for display and recording).
+
+    Returns
+    -------
+    stages: list
+        The stages, in order.
+    """
+    detection = detectionStage(config['marker'], source)
+    stages = [processingStage(config, source), detection]
+    if annotate:
+        stages.append(annotationStage(detection))
+    return stages
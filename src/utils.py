@@ -9,11 +9,16 @@ You may not use this file except in compliance with the License.
 """
 
 import io
+import sys
 import yaml
 import pstats
 import argparse
 import cProfile
 
+# Valid runner modes
+RUNNER_MODES = ["sv_offImg", "sv_offVid", "sv_offImgUV",
+                "dv_usb", "sv_usbUv", "sv_usbIr", "dv_ids", "sv_rs"]
+
 
 def startProfiler() -> cProfile.Profile:
     """
@@ -56,6 +61,7 @@ def stopProfiler(profile: cProfile.Profile):
 def readConfig(configFilePath: str) -> dict:
     """
     Reads the configuration file available in the config folder.
+    Messages go to stderr (stdout may carry the detections in headless mode).
 
     Parameters:
     ----------
@@ -70,7 +76,8 @@ def readConfig(configFilePath: str) -> dict:
     # Variables
     config = {}
     print(
-        f"[Info] Reading the contents of the configuration file '{configFilePath}' ...")
+        f"[Info] Reading the contents of the configuration file '{configFilePath}' ...",
+        file=sys.stderr)
 
     try:
         # Read configuration YAML from the given path
@@ -79,24 +86,24 @@ def readConfig(configFilePath: str) -> dict:
         # Check if the config is empty
         if config is None:
             print(
-                f"[Error] The configuration file '{configFilePath}' is empty. Exiting ...")
+                f"[Error] The configuration file '{configFilePath}' is empty. Exiting ...", file=sys.stderr)
             exit(1)
         # Return the config
         return config
     # Handle exceptions
     except FileNotFoundError:
         print(
-            f"[Error] The configuration file '{configFilePath}' was not found. Exiting ...")
+            f"[Error] The configuration file '{configFilePath}' was not found. Exiting ...", file=sys.stderr)
         exit(1)
     except yaml.YAMLError as e:
-        print(f"[Error] Error reading the configuration file: {e}")
+        print(f"[Error] Error reading the configuration file: {e}", file=sys.stderr)
         exit(1)
     except Exception as e:
-        print(f"[Error] An unexpected error occurred: {e}")
+        print(f"[Error] An unexpected error occurred: {e}", file=sys.stderr)
         exit(1)
 
 
-def argParser(mode: str) -> str:
+def argParser(mode: str) -> tuple:
     """
     Parse command line arguments and override the mode if provided.
 
@@ -109,31 +116,36 @@ def argParser(mode: str) -> str:
     ----------
     mode: str
         The mode to be used for the runner.
+    args: argparse.Namespace
+        The other parsed arguments (e.g., `headless`, `batch` and `output`).
     """
-    # Variables
-    validModes = ["sv_offImg", "sv_offVid", "sv_offImgUV",
-                  "dv_usb", "sv_usbUv", "sv_usbIr", "dv_ids", "sv_rs"]
-
     # Create an argument parser
     parser = argparse.ArgumentParser()
 
     # Add arguments to override config values
     parser.add_argument(
         '--mode', type=str, help="Override runner mode (sv_rs, dv_ids, dv_usb, sv_offVid, sv_offImg)")
+    parser.add_argument(
+        '--headless', action='store_true', help="Run without GUI, streaming the detections as JSON lines")
+    parser.add_argument(
+        '--batch', action='store_true', help="Process the offline data of the mode in a process pool, without GUI")
+    parser.add_argument(
+        '--output', type=str, help="File to write the detections to in headless/batch mode (default: stdout)")
 
     # New mode
-    newMode = parser.parse_args().mode
+    args = parser.parse_args()
+    newMode = args.mode
 
     # Check if the mode is valid
-    if newMode and newMode in validModes and newMode != mode:
+    if newMode and newMode in RUNNER_MODES and newMode != mode:
         print(
-            f'[Info] a new mode "{newMode}" is set using arguments, different from "{mode}" in the config file ...')
+            f'[Info] a new mode "{newMode}" is set using arguments, different from "{mode}" in the config file ...', file=sys.stderr)
         mode = newMode
 
     # Check if the mode is valid
-    if newMode and newMode not in validModes:
+    if newMode and newMode not in RUNNER_MODES:
         print(
-            f'[Warn] skipping the mode "{newMode}" set using arguments due to invalidity. Reading mode from the config file ...')
+            f'[Warn] skipping the mode "{newMode}" set using arguments due to invalidity. Reading mode from the config file ...', file=sys.stderr)
 
     # Return the parsed arguments
-    return mode
+    return mode, args